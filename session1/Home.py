@@ -2,13 +2,10 @@
 # app.py
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import matplotlib.pyplot as plt
+import plotly.graph_objects as go
 import uuid
-from PIL import Image
-import base64
-import time
-import random
+from functools import partial
+import requests
 import utils.authenticate as authenticate
 import utils.common as common
 # Set page configuration
@@ -28,23 +25,24 @@ AWS_COLORS = {
     "dark": "#161E2D"         # Darker Blue
 }
 
-# Apply custom styles
-def apply_custom_styles():
-    st.markdown("""
+# Custom styles - built once at import. The <style> element still has to be
+# emitted on every rerun, otherwise Streamlit removes it from the page.
+_CUSTOM_STYLES = """
     <style>
     .main {
         background-color: #F8F8F8;
     }
-    .stTabs [data-baseweb="tab-list"] {
+    /* Tab look for the render_lazy_tabs radios, selected by widget key */
+    :is(.st-key-main_section, .st-key-vp_tabs, .st-key-infra_tabs, .st-key-service_tabs) [role="radiogroup"] {
         gap: 10px;
     }
-    .stTabs [data-baseweb="tab"] {
+    :is(.st-key-main_section, .st-key-vp_tabs, .st-key-infra_tabs, .st-key-service_tabs) [role="radiogroup"] label {
         background-color: #FFFFFF;
         border-radius: 4px 4px 0px 0px;
         padding: 10px 16px;
         font-weight: 600;
     }
-    .stTabs [aria-selected="true"] {
+    :is(.st-key-main_section, .st-key-vp_tabs, .st-key-infra_tabs, .st-key-service_tabs) [role="radiogroup"] label:has(input:checked) {
         background-color: #FF9900 !important;
         color: white !important;
     }
@@ -76,31 +74,378 @@ def apply_custom_styles():
         font-size: 14px;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+# Apply custom styles
+def apply_custom_styles():
+    st.markdown(_CUSTOM_STYLES, unsafe_allow_html=True)
 
 # Initialize session state
 def initialize_session():
-    if 'session_id' not in st.session_state:
-        st.session_state['session_id'] = str(uuid.uuid4())
-    
-    if 'knowledge_check_progress' not in st.session_state:
-        st.session_state['knowledge_check_progress'] = 0
-        
-    if 'knowledge_check_answers' not in st.session_state:
-        st.session_state['knowledge_check_answers'] = {}
-    
-    if 'knowledge_check_results' not in st.session_state:
-        st.session_state['knowledge_check_results'] = False
+    ss = st.session_state
+    if 'session_id' not in ss:
+        ss['session_id'] = str(uuid.uuid4())
+    ss.setdefault('knowledge_check_progress', 0)
+    ss.setdefault('knowledge_check_answers', [None] * QUESTION_COUNT)
+    ss.setdefault('knowledge_check_results', False)
 
 # Reset session
 def reset_session():
-    for key in list(st.session_state.keys()):
-        if key != 'session_id':
-            del st.session_state[key]
+    session_id = st.session_state['session_id']
+    st.session_state.clear()
+    st.session_state['session_id'] = session_id
     st.session_state['knowledge_check_progress'] = 0
-    st.session_state['knowledge_check_answers'] = {}
+    st.session_state['knowledge_check_answers'] = [None] * QUESTION_COUNT
     st.session_state['knowledge_check_results'] = False
-    st.experimental_rerun()
+    st.rerun()
+
+# Remote images - downloaded once and served from the cache on later reruns
+BADGE_URL = "https://d1.awsstatic.com/training-and-certification/certification-badges/AWS-Certified-Cloud-Practitioner_badge.634f8a21af2e0e956ed8905a72366146ba22b74c.png"
+ECONOMY_OF_SCALE_URL = "https://d2908q01vomqb2.cloudfront.net/fc074d501302eb2b93e2554793fcaf50b3bf7291/2021/07/15/Figure-1.-Cloud-operating-model-%E2%80%93-Economic-value-loop.png"
+GLOBAL_INFRA_MAP_URL = "https://d1.awsstatic.com/about-aws/regions/Global%20Infrastructure%20Map_3-22-2022.3ffd139a7eac1655a72a0b19dc7e4501eaac8848.png"
+INFRA_TIERS_URL = "https://d1.awsstatic.com/global-infrastructure/infrastructure-tiers.8a0d4c57804a0c2e42f25159613404a5546afbdb.png"
+REGIONS_MAP_URL = "https://d1.awsstatic.com/global-infrastructure/maps/Global-Infrastructure-Map_3-1-23.c3867f3ed2a80e81bbc5fa91677b4a4b269c6423.png"
+AZ_ARCHITECTURE_URL = "https://d1.awsstatic.com/Product-Page-Diagram_Amazon-Global-Locations.8a2592e10a19bffd2f2bf89c7fe3c551801bef5c.png"
+CLOUDFRONT_HIW_URL = "https://d1.awsstatic.com/product-marketing/CloudFront/product-page-diagram_CloudFront_HIW.654ffe23bfbc37d65132995c983e47f9107ea970.png"
+EC2_HIW_URL = "https://d1.awsstatic.com/Products/product-name/diagrams/product-page-diagram_Amazon-EC2_HIW.cf4c2bd7a7f2d3be0f8dd9f43e68ae37082284fc.png"
+LAMBDA_HIW_URL = "https://d1.awsstatic.com/product-marketing/Lambda/Diagrams/product-page-diagram_Lambda-HowItWorks.68a0bcacfcf46fccf04b97f16b686ea44494303f.png"
+S3_HIW_URL = "https://d1.awsstatic.com/s3-pdp-redesign/product-page-diagram_Amazon-S3_HIW.cf4c2bd7a7f2d3be0f8dd9f43e68ae37082284fc.png"
+EBS_HIW_URL = "https://d1.awsstatic.com/product-marketing/Elastic%20Block%20Store/Product-Page-Diagram_Amazon-Elastic-Block-Store.9fed315519e1cecae3669bb094ef5351654f020f.png"
+RDS_HIW_URL = "https://d1.awsstatic.com/video-thumbs/RDS/product-page-diagram_Amazon-RDS-Regular-Deployment_HIW.96244168f48394137b1faf3b4149a5185eac33f0.png"
+DYNAMODB_HIW_URL = "https://d1.awsstatic.com/product-page-diagram_Amazon-DynamoDBa.1f8742b4f5bfb8cd41a3d4d2d7c5286aac97d9ff.png"
+VPC_BASIC_URL = "https://d1.awsstatic.com/Digital%20Marketing/House/1up/products/VPC/Product-Page-Diagram_Amazon-VPC_Basic-VPC.e05a31086b7591a144088d0ce38b479551903329.png"
+ROUTE53_HIW_URL = "https://d1.awsstatic.com/Route53/product-page-diagram_Amazon-Route-53_HIW%402x.4c2af00405a0825f83fcc6b3497ffaee6981be53.png"
+
+@st.cache_resource(ttl=24 * 60 * 60, show_spinner=False)
+def _download_image(url):
+    # Raises on failure, so only successful downloads are kept for the day
+    response = requests.get(url, timeout=2)
+    response.raise_for_status()
+    return response.content
+
+@st.cache_resource(ttl=5 * 60, show_spinner=False)
+def load_image(url):
+    # Fall back to letting the browser load the URL if the download fails. The
+    # fallback is cached for a few minutes so hosts without outbound access don't
+    # retry on every rerun, while a transient failure doesn't stick for a day.
+    try:
+        return _download_image(url)
+    except requests.RequestException:
+        return url
+
+# Diagram name -> (image URL, caption), so each call site is a single lookup
+DIAGRAMS = {
+    "economy_of_scale": (ECONOMY_OF_SCALE_URL, "AWS Economy of Scale Model"),
+    "global_infra_map": (GLOBAL_INFRA_MAP_URL, "AWS Global Infrastructure"),
+    "infra_tiers": (INFRA_TIERS_URL, "AWS Global Infrastructure Tiers"),
+    "regions_map": (REGIONS_MAP_URL, "AWS Regions Global Map"),
+    "az_architecture": (AZ_ARCHITECTURE_URL, "AWS Availability Zone Architecture"),
+    "cloudfront": (CLOUDFRONT_HIW_URL, "How Amazon CloudFront Works"),
+    "ec2": (EC2_HIW_URL, "How Amazon EC2 Works"),
+    "lambda": (LAMBDA_HIW_URL, "How AWS Lambda Works"),
+    "s3": (S3_HIW_URL, "How Amazon S3 Works"),
+    "ebs": (EBS_HIW_URL, "How Amazon EBS Works"),
+    "rds": (RDS_HIW_URL, "How Amazon RDS Works"),
+    "dynamodb": (DYNAMODB_HIW_URL, "How Amazon DynamoDB Works"),
+    "vpc": (VPC_BASIC_URL, "Amazon VPC Architecture"),
+    "route53": (ROUTE53_HIW_URL, "How Route 53 Works"),
+}
+
+def show_diagram(name):
+    url, caption = DIAGRAMS[name]
+    st.image(load_image(url), caption=caption)
+
+# Static tables - built once per process and shared read-only. cache_resource
+# hands back the same DataFrame instead of unpickling a copy on every rerun.
+# Every column is text, so dtype="string" skips pandas' type inference.
+@st.cache_resource(show_spinner=False)
+def _program_df():
+    return pd.DataFrame({
+        "Task": ["Attend Kickoff Session", "Complete AWS Cloud Practitioner Essentials", 
+                "Attend Study Session 1", "Attend Study Session 2", "Attend Study Session 3", "Schedule Exam"],
+        "Description": ["You Are Here! We will cover program basics and summarize your next 4 weeks of learning.",
+                      "Complete the Cloud Practitioner Essentials Learning Plan to develop a fundamental understanding of the AWS Cloud.",
+                      "Review a range of AWS technologies, cloud concepts, security & compliance, and billing & pricing",
+                      "Review the AWS Well-Architected Framework, exam strategy, best practices, and intro to CloudQuest",
+                      "Apply knowledge and test concepts through a series of practice exam questions",
+                      "It's a pleasure supporting you on your AWS Certification journey! Best of luck on your exam!"],
+        "Duration": ["60 minutes", "~8 hours", "90 minutes", "90 minutes", "90 minutes", "Schedule Exam"]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _capex_opex_df():
+    return pd.DataFrame({
+        "Capital Expense": ["Buildings", "Vehicles", "Equipment", "Office furniture", "Machinery", "Trademarks"],
+        "Variable/Operating Expense": ["Electricity", "Software", "Rent", "Salaries", "Accounting fees", "Utilities"]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _infrastructure_metrics_df():
+    return pd.DataFrame({
+        "Component": ["Regions", "Availability Zones", "Edge Locations", "Local Zones"],
+        "Count": ["31+", "99+", "550+", "29+"]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _instance_types_df():
+    return pd.DataFrame({
+        "Type": ["General Purpose", "Compute Optimized", "Memory Optimized", "Storage Optimized", "Accelerated Computing"],
+        "Use Case": ["Balanced resources, web servers, code repositories", 
+                   "Batch processing, media transcoding, gaming servers",
+                   "High-performance databases, in-memory analytics",
+                   "Data warehousing, log processing, distributed file systems",
+                   "Machine learning, video processing, graphics applications"]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _container_services_df():
+    return pd.DataFrame({
+        "Service": ["Amazon ECS (Elastic Container Service)", "Amazon EKS (Elastic Kubernetes Service)", "AWS Fargate"],
+        "Description": [
+            "Fully managed container orchestration service for Docker containers",
+            "Fully managed Kubernetes service to run Kubernetes without installing or maintaining control plane",
+            "Serverless compute engine for containers that works with both ECS and EKS"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _storage_classes_df():
+    return pd.DataFrame({
+        "Storage Class": ["S3 Standard", "S3 Standard-IA", "S3 One Zone-IA", "S3 Intelligent-Tiering", 
+                        "S3 Glacier Instant Retrieval", "S3 Glacier Flexible Retrieval", "S3 Glacier Deep Archive"],
+        "Use Case": [
+            "General-purpose storage for frequently accessed data",
+            "Long-lived, infrequently accessed data",
+            "Non-critical, infrequently accessed data",
+            "Data with unknown or changing access patterns",
+            "Archive data that needs immediate access",
+            "Long-term data archive with retrieval times of minutes to hours",
+            "Long-term data archive with retrieval times of hours"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _volume_types_df():
+    return pd.DataFrame({
+        "Type": ["General Purpose SSD (gp2/gp3)", "Provisioned IOPS SSD (io1/io2)", 
+               "Throughput Optimized HDD (st1)", "Cold HDD (sc1)"],
+        "Use Case": [
+            "Boot volumes, dev/test environments",
+            "I/O intensive workloads, databases",
+            "Big data, data warehouses, log processing",
+            "Infrequently accessed data, lowest cost"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _other_storage_df():
+    return pd.DataFrame({
+        "Service": ["Amazon EFS (Elastic File System)", "Amazon FSx", "AWS Storage Gateway", "AWS Snow Family"],
+        "Description": [
+            "Fully managed elastic file system for use with AWS Cloud and on-premises resources",
+            "Fully managed file storage services for Windows (FSx for Windows) and Lustre (FSx for Lustre)",
+            "Hybrid cloud storage service that connects on-premises environments with cloud storage",
+            "Physical devices to migrate data into and out of AWS (Snowcone, Snowball, Snowmobile)"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _engines_df():
+    return pd.DataFrame({
+        "Engine": ["MySQL", "PostgreSQL", "MariaDB", "Oracle", "Microsoft SQL Server", "Amazon Aurora"],
+        "Use Case": [
+            "Web applications, e-commerce",
+            "Geographic applications, enterprise applications",
+            "Website databases, CMS systems",
+            "Enterprise applications, legacy applications",
+            "Enterprise applications, Windows ecosystem",
+            "High-performance enterprise applications"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _other_dbs_df():
+    return pd.DataFrame({
+        "Service": ["Amazon Aurora", "Amazon ElastiCache", "Amazon Neptune", "Amazon DocumentDB", "Amazon Keyspaces", "Amazon MemoryDB"],
+        "Type": [
+            "Relational", "In-Memory", "Graph", "Document", "Wide Column", "In-Memory"
+        ],
+        "Description": [
+            "MySQL/PostgreSQL-compatible relational database with up to 5x performance",
+            "Fully managed Redis or Memcached for in-memory caching",
+            "Fully managed graph database service for connected datasets",
+            "MongoDB-compatible document database service",
+            "Apache Cassandra-compatible wide column database",
+            "Redis-compatible, durable in-memory database"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _policies_df():
+    return pd.DataFrame({
+        "Policy": ["Simple", "Weighted", "Latency-based", "Failover", "Geolocation", "Multivalue Answer"],
+        "Use Case": [
+            "Single resource serving content",
+            "Distribute traffic across multiple resources",
+            "Route users to the lowest-latency endpoint",
+            "Active-passive failover configuration",
+            "Route traffic based on user location",
+            "Respond with multiple healthy records selected randomly"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _other_networking_df():
+    return pd.DataFrame({
+        "Service": ["AWS Direct Connect", "Elastic Load Balancing", "Amazon CloudFront", "AWS Transit Gateway", "AWS Global Accelerator"],
+        "Description": [
+            "Dedicated network connection from on-premises to AWS",
+            "Distributes incoming application traffic across multiple targets",
+            "Global content delivery network (CDN) service",
+            "Centrally manage connectivity between VPCs and on-premises networks",
+            "Improve availability and performance of applications with global users"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _mgmt_services_df():
+    return pd.DataFrame({
+        "Service": ["AWS CloudFormation", "AWS CloudTrail", "Amazon CloudWatch", "AWS Config", "AWS Systems Manager"],
+        "Description": [
+            "Create and manage resources with templates (Infrastructure as Code)",
+            "Track user activity and API usage for compliance and audit",
+            "Monitor resources and applications with metrics, logs, and alarms",
+            "Assess, audit, and evaluate configurations of resources",
+            "Operational insights and actions across resources"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _security_services_df():
+    return pd.DataFrame({
+        "Service": ["AWS Identity and Access Management (IAM)", "Amazon Cognito", "AWS Shield", "AWS WAF", "Amazon GuardDuty"],
+        "Description": [
+            "Securely control access to AWS services and resources",
+            "Add user sign-up, sign-in, and access control to apps",
+            "DDoS protection service for applications",
+            "Web application firewall to protect against common exploits",
+            "Intelligent threat detection service"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _integration_services_df():
+    return pd.DataFrame({
+        "Service": ["Amazon SQS", "Amazon SNS", "AWS Step Functions", "Amazon EventBridge", "Amazon MQ"],
+        "Description": [
+            "Fully managed message queuing service",
+            "Fully managed pub/sub messaging service",
+            "Coordinate components of distributed applications",
+            "Serverless event bus for applications",
+            "Managed message broker service for ActiveMQ and RabbitMQ"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _ml_services_df():
+    return pd.DataFrame({
+        "Service": ["Amazon SageMaker", "Amazon Rekognition", "Amazon Transcribe", "Amazon Comprehend", "Amazon Lex"],
+        "Description": [
+            "Build, train, and deploy machine learning models",
+            "Add image and video analysis to applications",
+            "Convert speech to text",
+            "Natural language processing service",
+            "Build conversational interfaces (chatbots)"
+        ]
+    }, dtype="string")
+
+@st.cache_resource(show_spinner=False)
+def _dev_services_df():
+    return pd.DataFrame({
+        "Service": ["AWS CodeCommit", "AWS CodeBuild", "AWS CodeDeploy", "AWS CodePipeline", "AWS Cloud9"],
+        "Description": [
+            "Fully managed source control service",
+            "Compile source code, run tests, and produce packages",
+            "Automate code deployments to any instance",
+            "Continuous delivery service for fast updates",
+            "Cloud-based IDE for writing, running, and debugging code"
+        ]
+    }, dtype="string")
+
+# Static HTML panels - headings and small static tables are rendered to one
+# HTML blob and emitted as a single markdown element, skipping the Arrow
+# serialization st.table does on every rerun
+_HTML_SECTIONS = {
+    "other_storage": (None, (("Other Storage Services", _other_storage_df),)),
+    "other_databases": (None, (("Other Database Services", _other_dbs_df),)),
+    "other_networking": (None, (("Other Networking Services", _other_networking_df),)),
+    "other_services": (
+        "Other Key AWS Services",
+        (
+            ("Management & Governance", _mgmt_services_df),
+            ("Security, Identity & Compliance", _security_services_df),
+            ("Application Integration", _integration_services_df),
+            ("Machine Learning", _ml_services_df),
+            ("Developer Tools", _dev_services_df),
+        ),
+    ),
+}
+
+# Every panel of the service catalog is rendered in one pass on first use and the
+# resulting section -> HTML dict is shared by all sessions
+@st.cache_resource(show_spinner=False)
+def render_service_catalog():
+    catalog = {}
+    for section, (title, tables) in _HTML_SECTIONS.items():
+        parts = [f"### {title}"] if title else []
+        for i, (heading, build_df) in enumerate(tables):
+            if i:
+                parts.append("---")
+            parts.append(f"### {heading}")
+            parts.append(build_df().to_html(index=False, border=0))
+        catalog[section] = "\n\n".join(parts)
+    return catalog
+
+def _section_html(section):
+    return render_service_catalog()[section]
+
+# Static charts - figures are shared across reruns rather than redrawn
+@st.cache_resource(show_spinner=False)
+def _cost_structure_df():
+    return pd.DataFrame(
+        {"On-Premises": [35, 25, 20, 20], "Cloud": [5, 0, 10, 15]},
+        index=['Hardware', 'Facilities', 'Admin', 'Software']
+    )
+
+@st.cache_resource(show_spinner=False)
+def _datacenter_pie_fig():
+    fig = go.Figure(go.Pie(
+        labels=['Real Estate', 'Hardware', 'Power & Cooling', 'Networking', 'Security', 'IT Staff'],
+        values=[15, 25, 20, 15, 10, 15],
+        marker_colors=['#232F3E', '#FF9900', '#0073BB', '#527FFF', '#8C1D40', '#007078'],
+        textinfo='label+percent',
+        sort=False
+    ))
+    fig.update_layout(title='Data Center Cost Breakdown', showlegend=False)
+    return fig
+
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_ACTUAL_USAGE = (10000, 15000, 18000, 20000, 32000, 28000, 25000, 30000, 35000, 30000, 25000, 30000)
+_FIXED_CAPACITY = (35000,) * 12
+_DYNAMIC_CAPACITY = (11000, 16000, 19000, 21000, 33000, 29000, 26000, 31000, 36000, 31000, 26000, 31000)
+
+@st.cache_resource(show_spinner=False)
+def _capacity_fig(title, capacity):
+    fig = go.Figure()
+    fig.add_scatter(x=_MONTHS, y=capacity, mode='lines', name='Provisioned Capacity')
+    fig.add_scatter(x=_MONTHS, y=_ACTUAL_USAGE, mode='lines', name='Actual Usage')
+    fig.update_layout(title=title, xaxis_title='Month', yaxis_title='Capacity/Usage', legend_title_text='')
+    return fig
+
+# Lazily rendered tabs - only the selected tab's body is executed on a rerun
+def render_lazy_tabs(tabs, key):
+    choice = st.radio(key, list(tabs), horizontal=True, label_visibility="collapsed", key=key)
+    tabs[choice]()
 
 # Home Page Content
 def show_home():
@@ -109,38 +454,28 @@ def show_home():
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown("### Welcome to the AWS Partner Certification Readiness - Cloud Practitioner!")
-        st.markdown("This interactive e-learning application will guide you through the content covered in Session 1 of the AWS Cloud Practitioner certification preparation.")
-        
-        st.markdown("### Learning Outcomes")
         st.markdown("""
+        ### Welcome to the AWS Partner Certification Readiness - Cloud Practitioner!
+        This interactive e-learning application will guide you through the content covered in Session 1 of the AWS Cloud Practitioner certification preparation.
+        
+        ### Learning Outcomes
+        
         - Understand the Cloud Value Proposition of AWS
         - Explore AWS Global Infrastructure
         - Introduction to AWS Services
-        """)
         
-        st.markdown("### Weekly Program Summary")
-        program_data = {
-            "Task": ["Attend Kickoff Session", "Complete AWS Cloud Practitioner Essentials", 
-                    "Attend Study Session 1", "Attend Study Session 2", "Attend Study Session 3", "Schedule Exam"],
-            "Description": ["You Are Here! We will cover program basics and summarize your next 4 weeks of learning.",
-                          "Complete the Cloud Practitioner Essentials Learning Plan to develop a fundamental understanding of the AWS Cloud.",
-                          "Review a range of AWS technologies, cloud concepts, security & compliance, and billing & pricing",
-                          "Review the AWS Well-Architected Framework, exam strategy, best practices, and intro to CloudQuest",
-                          "Apply knowledge and test concepts through a series of practice exam questions",
-                          "It's a pleasure supporting you on your AWS Certification journey! Best of luck on your exam!"],
-            "Duration": ["60 minutes", "~8 hours", "90 minutes", "90 minutes", "90 minutes", "Schedule Exam"]
-        }
-        
-        df = pd.DataFrame(program_data)
-        st.table(df)
+        ### Weekly Program Summary
+        """)
+        st.dataframe(_program_df(), hide_index=True, use_container_width=True,
+                     column_config={"Description": st.column_config.TextColumn(width="large")})
     
     with col2:
-        st.image("https://d1.awsstatic.com/training-and-certification/certification-badges/AWS-Certified-Cloud-Practitioner_badge.634f8a21af2e0e956ed8905a72366146ba22b74c.png", 
+        st.image(load_image(BADGE_URL), 
                  caption="AWS Cloud Practitioner", width=300)
         
-        st.markdown("### Getting Started")
         st.markdown("""
+        ### Getting Started
+        
         1. Navigate through topics using the tabs above
         2. Test your knowledge in the Knowledge Check section
         3. Take notes and engage with the interactive examples
@@ -153,73 +488,42 @@ def show_home():
             - [AWS Certification Official Practice Exams](https://aws.amazon.com/certification/certification-prep/)
             """)
 
-# AWS Value Proposition Content
-def show_value_proposition():
-    st.title("Value Proposition of AWS")
-    st.markdown("### Major Advantages of Cloud over On-Premises")
-    
-    # Create tabs for different value propositions
-    vp_tabs = st.tabs(["Trade Fixed for Variable Expense", "Economies of Scale", 
-                       "Stop Guessing Capacity", "Increase Speed & Agility", 
-                       "Stop Data Center Spend", "Go Global in Minutes"])
+# Value Proposition tabs
+def _render_capex():
+    col1, col2 = st.columns([3, 2])
     
-    with vp_tabs[0]:
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            st.markdown("### Trade Capital Expense for Variable Expense")
-            st.markdown("""
+    with col1:
+        st.markdown("""
+            ### Trade Capital Expense for Variable Expense
+            
             Instead of having to invest heavily in data centers and servers before you know how you're going to use them, 
             you can pay only when you consume computing resources, and pay only for how much you consume.
-            """)
-            
-            st.markdown("#### Capital vs Variable Expenses")
-            capex_opex = {
-                "Capital Expense": ["Buildings", "Vehicles", "Equipment", "Office furniture", "Machinery", "Trademarks"],
-                "Variable/Operating Expense": ["Electricity", "Software", "Rent", "Salaries", "Accounting fees", "Utilities"]
-            }
-            
-            df = pd.DataFrame(capex_opex)
-            st.table(df)
-        
-        with col2:
-            # Create visualization
-            fig, ax = plt.subplots(figsize=(8, 6))
-            
-            categories = ['Hardware', 'Facilities', 'Admin', 'Software']
-            on_prem = [35, 25, 20, 20]
-            cloud = [5, 0, 10, 15]
-            
-            x = range(len(categories))
-            width = 0.35
             
-            ax.bar([i - width/2 for i in x], on_prem, width, label='On-Premises', color='#232F3E')
-            ax.bar([i + width/2 for i in x], cloud, width, label='Cloud', color='#FF9900')
-            
-            ax.set_xlabel('Cost Categories')
-            ax.set_ylabel('Percentage of Total Cost')
-            ax.set_title('On-Premises vs Cloud Cost Structure')
-            ax.set_xticks(x)
-            ax.set_xticklabels(categories)
-            ax.legend()
-            
-            st.pyplot(fig)
-            
-            st.info("With AWS, you transform large upfront expenses into smaller, predictable operational costs.")
+            #### Capital vs Variable Expenses
+            """)
+        st.dataframe(_capex_opex_df(), hide_index=True, use_container_width=True)
     
-    with vp_tabs[1]:
-        st.markdown("### Benefit from Massive Economies of Scale")
-        st.markdown("""
+    with col2:
+        # Create visualization
+        st.markdown("#### On-Premises vs Cloud Cost Structure")
+        st.bar_chart(_cost_structure_df(), x_label='Cost Categories', y_label='Percentage of Total Cost',
+                     color=['#232F3E', '#FF9900'], stack=False)
+        
+        st.info("With AWS, you transform large upfront expenses into smaller, predictable operational costs.")
+
+def _render_scale():
+    st.markdown("""
+        ### Benefit from Massive Economies of Scale
+        
         By using cloud computing, you can achieve a lower variable cost than you can get on your own. 
         Because usage from hundreds of thousands of customers is aggregated in the cloud, providers such as AWS 
         can achieve higher economies of scale, which translates into lower pay-as-you-go prices.
         """)
-        
-        # Create economy of scale visualization
-        st.image("https://d2908q01vomqb2.cloudfront.net/fc074d501302eb2b93e2554793fcaf50b3bf7291/2021/07/15/Figure-1.-Cloud-operating-model-%E2%80%93-Economic-value-loop.png", 
-                caption="AWS Economy of Scale Model")
-        
-        st.markdown("""
+    
+    # Create economy of scale visualization
+    show_diagram("economy_of_scale")
+    
+    st.markdown("""
         #### AWS Economy of Scale Flywheel Effect
         1. More Customers → More AWS Usage
         2. More AWS Usage → More Infrastructure
@@ -227,167 +531,134 @@ def show_value_proposition():
         4. Lower Infrastructure Costs → Reduced Prices
         5. Reduced Prices → More Customers
         """)
-        
-        st.info("As AWS grows, the cost of running the infrastructure decreases, and these savings are passed back to customers.")
     
-    with vp_tabs[2]:
-        st.markdown("### Stop Guessing Capacity")
-        st.markdown("""
+    st.info("As AWS grows, the cost of running the infrastructure decreases, and these savings are passed back to customers.")
+
+def _render_capacity():
+    st.markdown("""
+        ### Stop Guessing Capacity
+        
         Eliminate guessing on your infrastructure capacity needs. When you make a capacity decision prior to deploying an application, 
         you often end up either sitting on expensive idle resources or dealing with limited capacity. 
         With cloud computing, these problems go away. You can access as much or as little capacity as you need, and scale up and down as required with only a few minutes' notice.
         """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Create traditional provisioning graph
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            capacity = [35000] * 12
-            actual_usage = [10000, 15000, 18000, 20000, 32000, 28000, 25000, 30000, 35000, 30000, 25000, 30000]
-            
-            fig = px.line(x=months, y=[capacity, actual_usage], 
-                         labels={"x": "Month", "y": "Capacity/Usage", "value": "Value"},
-                         title="Guesswork Provisioning vs. Actual Demand")
-            
-            fig.update_layout(legend_title_text='')
-            fig.update_traces(name='Provisioned Capacity', selector=dict(name="wide_variable_0"))
-            fig.update_traces(name='Actual Usage', selector=dict(name="wide_variable_1"))
-            
-            st.plotly_chart(fig)
-            st.caption("Traditional On-premises: Overprovisioning leads to wasted resources")
-        
-        with col2:
-            # Create dynamic provisioning graph
-            dynamic_capacity = [11000, 16000, 19000, 21000, 33000, 29000, 26000, 31000, 36000, 31000, 26000, 31000]
-            
-            fig = px.line(x=months, y=[dynamic_capacity, actual_usage], 
-                         labels={"x": "Month", "y": "Capacity/Usage", "value": "Value"},
-                         title="Dynamic Provisioning for Actual Demand")
-            
-            fig.update_layout(legend_title_text='')
-            fig.update_traces(name='Provisioned Capacity', selector=dict(name="wide_variable_0"))
-            fig.update_traces(name='Actual Usage', selector=dict(name="wide_variable_1"))
-            
-            st.plotly_chart(fig)
-            st.caption("AWS Cloud: Dynamic provisioning matches actual demand")
-        
-        st.success("AWS allows you to scale elastically - provision only what you need, when you need it.")
     
-    with vp_tabs[3]:
-        st.markdown("### Increase Speed and Agility")
-        st.markdown("""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Create traditional provisioning graph
+        st.plotly_chart(_capacity_fig("Guesswork Provisioning vs. Actual Demand", _FIXED_CAPACITY))
+        st.caption("Traditional On-premises: Overprovisioning leads to wasted resources")
+    
+    with col2:
+        # Create dynamic provisioning graph
+        st.plotly_chart(_capacity_fig("Dynamic Provisioning for Actual Demand", _DYNAMIC_CAPACITY))
+        st.caption("AWS Cloud: Dynamic provisioning matches actual demand")
+    
+    st.success("AWS allows you to scale elastically - provision only what you need, when you need it.")
+
+def _render_agility():
+    st.markdown("""
+        ### Increase Speed and Agility
+        
         In a cloud computing environment, new IT resources are only a click away, which means that you reduce the time to make those resources 
         available to your developers from weeks to just minutes. This results in a dramatic increase in agility for the organization, 
         since the cost and time it takes to experiment and develop is significantly lower.
         """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### Traditional IT Procurement Process")
-            traditional_steps = [
-                "1. Define Requirements (2-4 weeks)",
-                "2. Secure Budget Approval (1-4 weeks)",
-                "3. Vendor Selection & Negotiation (2-8 weeks)",
-                "4. Delivery & Installation (2-6 weeks)",
-                "5. Configuration & Testing (1-4 weeks)",
-                "6. Production Deployment (1-2 weeks)"
-            ]
-            
-            for step in traditional_steps:
-                st.markdown(f"- {step}")
-            
-            st.markdown("**Total Time: 9-28 weeks**")
-        
-        with col2:
-            st.markdown("#### AWS Provisioning Process")
-            aws_steps = [
-                "1. Define Requirements (1-5 days)",
-                "2. AWS Console Configuration (minutes)",
-                "3. Deployment & Testing (hours to days)",
-                "4. Production Deployment (minutes)"
-            ]
-            
-            for step in aws_steps:
-                st.markdown(f"- {step}")
-                
-            st.markdown("**Total Time: Days rather than months**")
-            
-            st.success("Faster time to market means more opportunity to innovate!")
     
-    with vp_tabs[4]:
-        st.markdown("### Stop Data Center Spend")
-        st.markdown("""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        traditional_steps = [
+            "1. Define Requirements (2-4 weeks)",
+            "2. Secure Budget Approval (1-4 weeks)",
+            "3. Vendor Selection & Negotiation (2-8 weeks)",
+            "4. Delivery & Installation (2-6 weeks)",
+            "5. Configuration & Testing (1-4 weeks)",
+            "6. Production Deployment (1-2 weeks)"
+        ]
+        
+        st.markdown("#### Traditional IT Procurement Process\n\n"
+                    + "\n".join(f"- {step}" for step in traditional_steps)
+                    + "\n\n**Total Time: 9-28 weeks**")
+    
+    with col2:
+        aws_steps = [
+            "1. Define Requirements (1-5 days)",
+            "2. AWS Console Configuration (minutes)",
+            "3. Deployment & Testing (hours to days)",
+            "4. Production Deployment (minutes)"
+        ]
+        
+        st.markdown("#### AWS Provisioning Process\n\n"
+                    + "\n".join(f"- {step}" for step in aws_steps)
+                    + "\n\n**Total Time: Days rather than months**")
+        
+        st.success("Faster time to market means more opportunity to innovate!")
+
+def _render_dc_spend():
+    st.markdown("""
+        ### Stop Data Center Spend
+        
         Focus on projects that differentiate your business, not the infrastructure. Cloud computing lets you focus on your own customers, 
         rather than on the heavy lifting of racking, stacking, and powering servers.
         """)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Create data center cost breakdown
-            labels = 'Real Estate', 'Hardware', 'Power & Cooling', 'Networking', 'Security', 'IT Staff'
-            sizes = [15, 25, 20, 15, 10, 15]
-            colors = ['#232F3E', '#FF9900', '#0073BB', '#527FFF', '#8C1D40', '#007078']
-            
-            fig, ax = plt.subplots()
-            ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-            ax.axis('equal')
-            plt.title('Data Center Cost Breakdown')
-            
-            st.pyplot(fig)
-        
-        with col2:
-            st.markdown("#### Hidden Costs of Running Your Own Data Center:")
-            dc_costs = [
-                "Real Estate - Purchase/leasing, security, management",
-                "Physical assets - Procurement, installation, maintenance",
-                "Power & Cooling - Continuous operation and optimization",
-                "Networking - Equipment, bandwidth contracts, management",
-                "Security - Physical and digital protection systems",
-                "Specialist staffing - 24/7 operations team, security personnel"
-            ]
-            
-            for cost in dc_costs:
-                st.markdown(f"- {cost}")
-            
-            st.info("None of these costs directly provide value to customers or add differentiation to your business.")
     
-    with vp_tabs[5]:
-        st.markdown("### Go Global in Minutes")
-        st.markdown("""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Create data center cost breakdown
+        st.plotly_chart(_datacenter_pie_fig())
+    
+    with col2:
+        dc_costs = [
+            "Real Estate - Purchase/leasing, security, management",
+            "Physical assets - Procurement, installation, maintenance",
+            "Power & Cooling - Continuous operation and optimization",
+            "Networking - Equipment, bandwidth contracts, management",
+            "Security - Physical and digital protection systems",
+            "Specialist staffing - 24/7 operations team, security personnel"
+        ]
+        
+        st.markdown("#### Hidden Costs of Running Your Own Data Center:\n\n"
+                    + "\n".join(f"- {cost}" for cost in dc_costs))
+        
+        st.info("None of these costs directly provide value to customers or add differentiation to your business.")
+
+def _render_global():
+    st.markdown("""
+        ### Go Global in Minutes
+        
         Easily deploy your application in multiple regions around the world with just a few clicks. 
         This means you can provide lower latency and a better experience for your customers at minimal cost.
         """)
+    
+    # Global deployment visualization
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        show_diagram("global_infra_map")
         
-        # Global deployment visualization
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            st.image("https://d1.awsstatic.com/about-aws/regions/Global%20Infrastructure%20Map_3-22-2022.3ffd139a7eac1655a72a0b19dc7e4501eaac8848.png",
-                    caption="AWS Global Infrastructure")
-            
-            st.markdown("""
+        st.markdown("""
             Deploy your application globally with AWS:
             - 31 geographic regions
             - 99 availability zones
             - 550+ points of presence
             - Low-latency content delivery to end users
             """)
-        
-        with col2:
-            st.markdown("#### Traditional Global Deployment")
-            st.markdown("""
+    
+    with col2:
+        st.markdown("""
+            #### Traditional Global Deployment
+            
             - Build multiple data centers
             - Manage complex networking
             - Negotiate with ISPs in each region
             - Maintain international IT staff
             - Address compliance per region
-            """)
             
-            st.markdown("#### AWS Global Deployment")
-            st.markdown("""
+            #### AWS Global Deployment
+            
             - Select regions in AWS Console
             - Deploy with a few clicks
             - Consistent management interface
@@ -395,18 +666,28 @@ def show_value_proposition():
             - Global network backbone
             """)
 
-# AWS Global Infrastructure Content
-def show_global_infrastructure():
-    st.title("AWS Global Infrastructure")
+# AWS Value Proposition Content
+@st.fragment
+def show_value_proposition():
+    st.title("Value Proposition of AWS")
+    st.markdown("### Major Advantages of Cloud over On-Premises")
     
-    # Create tabs for different infrastructure components
-    infra_tabs = st.tabs(["Overview", "Regions", "Availability Zones", "Edge Locations"])
+    # Create tabs for different value propositions
+    render_lazy_tabs({
+        "Trade Fixed for Variable Expense": _render_capex,
+        "Economies of Scale": _render_scale,
+        "Stop Guessing Capacity": _render_capacity,
+        "Increase Speed & Agility": _render_agility,
+        "Stop Data Center Spend": _render_dc_spend,
+        "Go Global in Minutes": _render_global,
+    }, key="vp_tabs")
+
+# Global Infrastructure tabs
+def _render_infra_overview():
+    col1, col2 = st.columns([2, 1])
     
-    with infra_tabs[0]:
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            st.markdown("""
+    with col1:
+        st.markdown("""
             AWS has built the most robust and powerful global infrastructure in the world, with AWS Regions offering multiple physically 
             separated and isolated Availability Zones connected with low-latency, high-throughput, redundant networking.
             
@@ -417,38 +698,32 @@ def show_global_infrastructure():
             - Low Latency
             - Global Reach
             """)
-            
-            # Global infrastructure metrics
-            metrics = {
-                "Component": ["Regions", "Availability Zones", "Edge Locations", "Local Zones"],
-                "Count": ["31+", "99+", "550+", "29+"]
-            }
-            
-            df = pd.DataFrame(metrics)
-            st.table(df)
         
-        with col2:
-            st.image("https://d1.awsstatic.com/global-infrastructure/infrastructure-tiers.8a0d4c57804a0c2e42f25159613404a5546afbdb.png",
-                    caption="AWS Global Infrastructure Tiers")
+        # Global infrastructure metrics
+        st.table(_infrastructure_metrics_df())
     
-    with infra_tabs[1]:
-        st.markdown("### AWS Regions")
-        st.markdown("""
+    with col2:
+        show_diagram("infra_tiers")
+
+def _render_regions():
+    st.markdown("""
+        ### AWS Regions
+        
         A Region is a physical location around the world where AWS clusters data centers. Each AWS Region consists of multiple, 
         isolated, and physically separate Availability Zones.
         
         AWS Regions are designed to be completely isolated from each other, which achieves the greatest possible fault tolerance and stability.
         """)
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            st.image("https://d1.awsstatic.com/global-infrastructure/maps/Global-Infrastructure-Map_3-1-23.c3867f3ed2a80e81bbc5fa91677b4a4b269c6423.png",
-                    caption="AWS Regions Global Map")
-        
-        with col2:
-            st.markdown("#### How to Choose a Region")
-            st.markdown("""
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        show_diagram("regions_map")
+    
+    with col2:
+        st.markdown("""
+            #### How to Choose a Region
+            
             When selecting a Region for your applications and workloads, consider:
             
             1. **Data Compliance** - Legal/regulatory requirements for where data can be stored
@@ -456,91 +731,101 @@ def show_global_infrastructure():
             3. **Feature Availability** - Some AWS services aren't available in all regions
             4. **Pricing** - Pricing varies by region due to local costs
             """)
-            
-            st.info("Example Region Name: us-east-1 (N. Virginia)")
-    
-    with infra_tabs[2]:
-        st.markdown("### AWS Availability Zones")
-        st.markdown("""
+        
+        st.info("Example Region Name: us-east-1 (N. Virginia)")
+
+def _render_azs():
+    st.markdown("""
+        ### AWS Availability Zones
+        
         An Availability Zone (AZ) is one or more discrete data centers with redundant power, networking, and connectivity in an AWS Region.
         
         AZs give customers the ability to operate production applications and databases that are more highly available, fault tolerant, 
         and scalable than would be possible from a single data center.
         """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        show_diagram("az_architecture")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.image("https://d1.awsstatic.com/Product-Page-Diagram_Amazon-Global-Locations.8a2592e10a19bffd2f2bf89c7fe3c551801bef5c.png",
-                    caption="AWS Availability Zone Architecture")
+    with col2:
+        st.markdown("""
+            #### Key Points About Availability Zones
             
-        with col2:
-            st.markdown("#### Key Points About Availability Zones")
-            st.markdown("""
             - All AZs in an AWS Region are interconnected with high-bandwidth, low-latency networking
             - Each AZ is physically separated (typically tens of miles apart)
             - AZs are designed to be isolated from failures in other AZs
             - Enterprise-grade physical security and controlled access
             - Connected through low-latency private links (not public internet)
             """)
-            
-            st.success("""
+        
+        st.success("""
             **Best Practice**: Deploy critical applications across multiple AZs to create high availability architecture.
             
             Example AZ Name: us-east-1a
             """)
-    
-    with infra_tabs[3]:
-        st.markdown("### Edge Locations & CloudFront")
-        st.markdown("""
+
+def _render_edge():
+    st.markdown("""
+        ### Edge Locations & CloudFront
+        
         AWS Edge Locations are sites deployed in major cities and highly populated areas across the globe. AWS uses Edge Locations 
         to deliver content to end users with lower latency.
         
         Edge Locations are separate from Regions, and are primarily used by Amazon CloudFront (CDN) and Amazon Route 53 (DNS).
         """)
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            # CloudFront diagram
-            st.image("https://d1.awsstatic.com/product-marketing/CloudFront/product-page-diagram_CloudFront_HIW.654ffe23bfbc37d65132995c983e47f9107ea970.png",
-                    caption="How Amazon CloudFront Works")
-        
-        with col2:
-            st.markdown("#### Services Using Edge Locations")
-            st.markdown("""
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        # CloudFront diagram
+        show_diagram("cloudfront")
+    
+    with col2:
+        st.markdown("""
+            #### Services Using Edge Locations
+            
             - **Amazon CloudFront** - Content Delivery Network (CDN)
             - **Amazon Route 53** - Domain Name System (DNS)
             - **AWS WAF** - Web Application Firewall
             - **AWS Shield** - DDoS protection
             - **Lambda@Edge** - Run code closer to users
             """)
-            
-            st.info("""
+        
+        st.info("""
             Edge Locations help reduce latency by caching content closer to end users, improving the overall experience of your applications.
             
             Currently, AWS maintains 550+ edge locations globally.
             """)
 
-# AWS Services Content
-def show_aws_services():
-    st.title("Introduction to AWS Services")
-    
-    # Create tabs for different service categories
-    service_tabs = st.tabs(["Compute", "Storage", "Database", "Networking", "Other Key Services"])
+# AWS Global Infrastructure Content
+@st.fragment
+def show_global_infrastructure():
+    st.title("AWS Global Infrastructure")
     
-    with service_tabs[0]:
-        st.markdown("### AWS Compute Services")
-        st.markdown("""
-        AWS offers a comprehensive portfolio of compute services to support a wide variety of workloads.
-        """)
-        
-        # EC2 section
-        st.subheader("Amazon EC2 - Elastic Compute Cloud")
-        col1, col2 = st.columns([3, 2])
+    # Create tabs for different infrastructure components
+    render_lazy_tabs({
+        "Overview": _render_infra_overview,
+        "Regions": _render_regions,
+        "Availability Zones": _render_azs,
+        "Edge Locations": _render_edge,
+    }, key="infra_tabs")
+
+# AWS Services tabs
+def _render_compute():
+    st.markdown("""
+        ### AWS Compute Services
         
-        with col1:
-            st.markdown("""
+        AWS offers a comprehensive portfolio of compute services to support a wide variety of workloads.
+        """)
+    
+    # EC2 section
+    st.subheader("Amazon EC2 - Elastic Compute Cloud")
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        st.markdown("""
             Amazon Elastic Compute Cloud (Amazon EC2) provides resizable compute capacity in the cloud. It is designed to make 
             web-scale cloud computing easier for developers.
             
@@ -551,43 +836,31 @@ def show_aws_services():
             - Secure and resizable compute capacity
             - Pay only for what you use
             """)
-            
-            with st.expander("EC2 Instance Types"):
-                instance_types = {
-                    "Type": ["General Purpose", "Compute Optimized", "Memory Optimized", "Storage Optimized", "Accelerated Computing"],
-                    "Use Case": ["Balanced resources, web servers, code repositories", 
-                               "Batch processing, media transcoding, gaming servers",
-                               "High-performance databases, in-memory analytics",
-                               "Data warehousing, log processing, distributed file systems",
-                               "Machine learning, video processing, graphics applications"]
-                }
-                
-                df = pd.DataFrame(instance_types)
-                st.table(df)
-        
-        with col2:
-            st.image("https://d1.awsstatic.com/Products/product-name/diagrams/product-page-diagram_Amazon-EC2_HIW.cf4c2bd7a7f2d3be0f8dd9f43e68ae37082284fc.png",
-                    caption="How Amazon EC2 Works")
-            
-            st.markdown("#### EC2 Pricing Options")
-            pricing_options = [
-                ("On-Demand", "Pay by the hour with no commitments"),
-                ("Reserved Instances", "1 or 3-year terms with significant discounts"),
-                ("Spot Instances", "Bid for unused capacity at up to 90% discount"),
-                ("Dedicated Hosts", "Physical servers dedicated for your use")
-            ]
-            
-            for option, description in pricing_options:
-                st.markdown(f"- **{option}**: {description}")
         
-        # Lambda section
-        st.markdown("---")
-        st.subheader("AWS Lambda - Serverless Computing")
+        with st.expander("EC2 Instance Types"):
+            st.dataframe(_instance_types_df(), hide_index=True, use_container_width=True)
+    
+    with col2:
+        show_diagram("ec2")
         
-        col1, col2 = st.columns([3, 2])
+        st.markdown("#### EC2 Pricing Options")
+        pricing_options = [
+            ("On-Demand", "Pay by the hour with no commitments"),
+            ("Reserved Instances", "1 or 3-year terms with significant discounts"),
+            ("Spot Instances", "Bid for unused capacity at up to 90% discount"),
+            ("Dedicated Hosts", "Physical servers dedicated for your use")
+        ]
         
-        with col1:
-            st.markdown("""
+        st.markdown("\n".join(f"- **{option}**: {description}" for option, description in pricing_options))
+    
+    # Lambda section
+    st.markdown("---")
+    st.subheader("AWS Lambda - Serverless Computing")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        st.markdown("""
             AWS Lambda lets you run code without provisioning or managing servers. You pay only for the compute time 
             you consume - there is no charge when your code is not running.
             
@@ -598,9 +871,9 @@ def show_aws_services():
             - Built-in fault tolerance
             - Supports multiple languages (Node.js, Python, Java, Go, etc.)
             """)
-            
-            with st.expander("Sample Lambda Function (Python)"):
-                st.code('''
+        
+        with st.expander("Sample Lambda Function (Python)"):
+            st.code('''
 import json
 
 def lambda_handler(event, context):
@@ -611,84 +884,75 @@ def lambda_handler(event, context):
         'body': json.dumps(f'Hello, {name}!')
     }
                 ''', language='python')
+    
+    with col2:
+        show_diagram("lambda")
+        
+        st.markdown("#### Common Lambda Use Cases")
+        use_cases = [
+            "Real-time file processing",
+            "Real-time stream processing",
+            "Backend for web, mobile, IoT",
+            "API endpoints",
+            "Task automation"
+        ]
+        
+        st.markdown("\n".join(f"- {use_case}" for use_case in use_cases))
+    
+    # Container services
+    st.markdown("---")
+    st.subheader("Container Services")
+    
+    st.dataframe(_container_services_df(), hide_index=True, use_container_width=True)
+    
+    st.info("**Key Difference:** Choose ECS for a simplified AWS-native experience, EKS if you're already using Kubernetes, and Fargate when you want to run containers without managing servers.")
+
+def _render_storage():
+    st.markdown("""
+        ### AWS Storage Services
         
-        with col2:
-            st.image("https://d1.awsstatic.com/product-marketing/Lambda/Diagrams/product-page-diagram_Lambda-HowItWorks.68a0bcacfcf46fccf04b97f16b686ea44494303f.png",
-                    caption="How AWS Lambda Works")
-            
-            st.markdown("#### Common Lambda Use Cases")
-            use_cases = [
-                "Real-time file processing",
-                "Real-time stream processing",
-                "Backend for web, mobile, IoT",
-                "API endpoints",
-                "Task automation"
-            ]
-            
-            for use_case in use_cases:
-                st.markdown(f"- {use_case}")
-        
-        # Container services
-        st.markdown("---")
-        st.subheader("Container Services")
-        
-        container_services = {
-            "Service": ["Amazon ECS (Elastic Container Service)", "Amazon EKS (Elastic Kubernetes Service)", "AWS Fargate"],
-            "Description": [
-                "Fully managed container orchestration service for Docker containers",
-                "Fully managed Kubernetes service to run Kubernetes without installing or maintaining control plane",
-                "Serverless compute engine for containers that works with both ECS and EKS"
-            ]
-        }
-        
-        df = pd.DataFrame(container_services)
-        st.table(df)
+        AWS provides multiple storage options to support your applications and data requirements.
         
-        st.info("**Key Difference:** Choose ECS for a simplified AWS-native experience, EKS if you're already using Kubernetes, and Fargate when you want to run containers without managing servers.")
+        #### Types of Storage in AWS
+        """)
+    
+    col1, col2, col3 = st.columns(3)
     
-    with service_tabs[1]:
-        st.markdown("### AWS Storage Services")
+    with col1:
         st.markdown("""
-        AWS provides multiple storage options to support your applications and data requirements.
-        """)
-        
-        # Storage types
-        st.markdown("#### Types of Storage in AWS")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("##### Object Storage")
-            st.markdown("""
+            ##### Object Storage
+            
             - Stores data as objects in buckets
             - Ideal for static files like images, videos
             - Example: Amazon S3
             """)
-        
-        with col2:
-            st.markdown("##### Block Storage")
-            st.markdown("""
+    
+    with col2:
+        st.markdown("""
+            ##### Block Storage
+            
             - Data stored in fixed-sized blocks
             - Used as hard drives for EC2 instances
             - Example: Amazon EBS
             """)
-        
-        with col3:
-            st.markdown("##### File Storage")
-            st.markdown("""
+    
+    with col3:
+        st.markdown("""
+            ##### File Storage
+            
             - Shared file storage with file-level access
             - Works like networked file systems
             - Example: Amazon EFS, FSx
             """)
-        
-        # S3 section
-        st.markdown("---")
-        st.subheader("Amazon S3 (Simple Storage Service)")
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            st.markdown("""
+    
+    # S3 section
+    st.markdown("---")
+    st.subheader("Amazon S3 (Simple Storage Service)")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        st.markdown("""
             Amazon S3 is object storage built to store and retrieve any amount of data from anywhere. It delivers 
             99.999999999% (11 9's) durability and stores data for millions of applications.
             
@@ -699,39 +963,23 @@ def lambda_handler(event, context):
             - Query-in-place functionality
             - Flexible management features
             """)
-            
-            with st.expander("S3 Storage Classes"):
-                storage_classes = {
-                    "Storage Class": ["S3 Standard", "S3 Standard-IA", "S3 One Zone-IA", "S3 Intelligent-Tiering", 
-                                    "S3 Glacier Instant Retrieval", "S3 Glacier Flexible Retrieval", "S3 Glacier Deep Archive"],
-                    "Use Case": [
-                        "General-purpose storage for frequently accessed data",
-                        "Long-lived, infrequently accessed data",
-                        "Non-critical, infrequently accessed data",
-                        "Data with unknown or changing access patterns",
-                        "Archive data that needs immediate access",
-                        "Long-term data archive with retrieval times of minutes to hours",
-                        "Long-term data archive with retrieval times of hours"
-                    ]
-                }
-                
-                df = pd.DataFrame(storage_classes)
-                st.table(df)
-        
-        with col2:
-            st.image("https://d1.awsstatic.com/s3-pdp-redesign/product-page-diagram_Amazon-S3_HIW.cf4c2bd7a7f2d3be0f8dd9f43e68ae37082284fc.png",
-                    caption="How Amazon S3 Works")
-            
-            st.success("S3 Standard provides 99.999999999% (11 9's) durability and 99.99% availability over the calendar year.")
-        
-        # EBS section
-        st.markdown("---")
-        st.subheader("Amazon EBS (Elastic Block Store)")
         
-        col1, col2 = st.columns([3, 2])
+        with st.expander("S3 Storage Classes"):
+            st.dataframe(_storage_classes_df(), hide_index=True, use_container_width=True)
+    
+    with col2:
+        show_diagram("s3")
         
-        with col1:
-            st.markdown("""
+        st.success("S3 Standard provides 99.999999999% (11 9's) durability and 99.99% availability over the calendar year.")
+    
+    # EBS section
+    st.markdown("---")
+    st.subheader("Amazon EBS (Elastic Block Store)")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        st.markdown("""
             Amazon EBS provides persistent block storage volumes for use with Amazon EC2 instances. Each Amazon EBS volume is 
             automatically replicated within its Availability Zone to protect from component failure.
             
@@ -742,55 +990,54 @@ def lambda_handler(event, context):
             - Different volume types for different workloads
             - Independent lifecycle from EC2 instances
             """)
-            
-            with st.expander("EBS Volume Types"):
-                volume_types = {
-                    "Type": ["General Purpose SSD (gp2/gp3)", "Provisioned IOPS SSD (io1/io2)", 
-                           "Throughput Optimized HDD (st1)", "Cold HDD (sc1)"],
-                    "Use Case": [
-                        "Boot volumes, dev/test environments",
-                        "I/O intensive workloads, databases",
-                        "Big data, data warehouses, log processing",
-                        "Infrequently accessed data, lowest cost"
-                    ]
-                }
-                
-                df = pd.DataFrame(volume_types)
-                st.table(df)
         
-        with col2:
-            st.image("https://d1.awsstatic.com/product-marketing/Elastic%20Block%20Store/Product-Page-Diagram_Amazon-Elastic-Block-Store.9fed315519e1cecae3669bb094ef5351654f020f.png",
-                    caption="How Amazon EBS Works")
-        
-        # Other storage services
-        st.markdown("---")
-        st.subheader("Other Storage Services")
-        
-        other_storage = {
-            "Service": ["Amazon EFS (Elastic File System)", "Amazon FSx", "AWS Storage Gateway", "AWS Snow Family"],
-            "Description": [
-                "Fully managed elastic file system for use with AWS Cloud and on-premises resources",
-                "Fully managed file storage services for Windows (FSx for Windows) and Lustre (FSx for Lustre)",
-                "Hybrid cloud storage service that connects on-premises environments with cloud storage",
-                "Physical devices to migrate data into and out of AWS (Snowcone, Snowball, Snowmobile)"
-            ]
-        }
-        
-        df = pd.DataFrame(other_storage)
-        st.table(df)
+        with st.expander("EBS Volume Types"):
+            st.table(_volume_types_df())
     
-    with service_tabs[2]:
-        st.markdown("### AWS Database Services")
-        st.markdown("""
+    with col2:
+        show_diagram("ebs")
+    
+    # Other storage services
+    st.markdown("---")
+    st.markdown(_section_html("other_storage"), unsafe_allow_html=True)
+
+# Sample table definition shown in the DynamoDB expander
+DYNAMODB_SAMPLE_JSON = '''
+{
+  "TableName": "Users",
+  "KeySchema": [
+    { "AttributeName": "user_id", "KeyType": "HASH" }
+  ],
+  "AttributeDefinitions": [
+    { "AttributeName": "user_id", "AttributeType": "S" },
+    { "AttributeName": "email", "AttributeType": "S" }
+  ],
+  "GlobalSecondaryIndexes": [
+    {
+      "IndexName": "EmailIndex",
+      "KeySchema": [
+        { "AttributeName": "email", "KeyType": "HASH" }
+      ],
+      "Projection": { "ProjectionType": "ALL" }
+    }
+  ]
+}
+'''
+
+def _render_database():
+    st.markdown("""
+        ### AWS Database Services
+        
         AWS offers purpose-built database services to support diverse application requirements.
         """)
-        
-        # Database types
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### Relational Databases")
-            st.markdown("""
+    
+    # Database types
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+            #### Relational Databases
+            
             **Characteristics:**
             - Structured data in tables with rows and columns
             - Relationships between tables
@@ -801,10 +1048,11 @@ def lambda_handler(event, context):
             - Amazon RDS
             - Amazon Aurora
             """)
-        
-        with col2:
-            st.markdown("#### Non-Relational Databases")
-            st.markdown("""
+    
+    with col2:
+        st.markdown("""
+            #### Non-Relational Databases
+            
             **Characteristics:**
             - Various data models (document, key-value, graph)
             - Schema flexibility
@@ -817,15 +1065,15 @@ def lambda_handler(event, context):
             - Amazon Neptune
             - Amazon Keyspaces
             """)
-        
-        # RDS section
-        st.markdown("---")
-        st.subheader("Amazon RDS (Relational Database Service)")
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            st.markdown("""
+    
+    # RDS section
+    st.markdown("---")
+    st.subheader("Amazon RDS (Relational Database Service)")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        st.markdown("""
             Amazon RDS makes it easy to set up, operate, and scale a relational database in the cloud. It provides 
             cost-efficient and resizable capacity while automating time-consuming administration tasks.
             
@@ -836,35 +1084,21 @@ def lambda_handler(event, context):
             - Automated failover capability
             - Easy scaling of compute and storage
             """)
-            
-            with st.expander("Supported Database Engines"):
-                engines = {
-                    "Engine": ["MySQL", "PostgreSQL", "MariaDB", "Oracle", "Microsoft SQL Server", "Amazon Aurora"],
-                    "Use Case": [
-                        "Web applications, e-commerce",
-                        "Geographic applications, enterprise applications",
-                        "Website databases, CMS systems",
-                        "Enterprise applications, legacy applications",
-                        "Enterprise applications, Windows ecosystem",
-                        "High-performance enterprise applications"
-                    ]
-                }
-                
-                df = pd.DataFrame(engines)
-                st.table(df)
         
-        with col2:
-            st.image("https://d1.awsstatic.com/video-thumbs/RDS/product-page-diagram_Amazon-RDS-Regular-Deployment_HIW.96244168f48394137b1faf3b4149a5185eac33f0.png",
-                    caption="How Amazon RDS Works")
-        
-        # DynamoDB section
-        st.markdown("---")
-        st.subheader("Amazon DynamoDB")
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            st.markdown("""
+        with st.expander("Supported Database Engines"):
+            st.table(_engines_df())
+    
+    with col2:
+        show_diagram("rds")
+    
+    # DynamoDB section
+    st.markdown("---")
+    st.subheader("Amazon DynamoDB")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        st.markdown("""
             Amazon DynamoDB is a fully managed NoSQL database service that provides fast and predictable performance with seamless scalability.
             
             **Key Features:**
@@ -874,81 +1108,42 @@ def lambda_handler(event, context):
             - Multi-region, multi-active replication
             - In-memory caching capability
             """)
-            
-            with st.expander("Sample DynamoDB Table Structure"):
-                st.code('''
-{
-  "TableName": "Users",
-  "KeySchema": [
-    { "AttributeName": "user_id", "KeyType": "HASH" }
-  ],
-  "AttributeDefinitions": [
-    { "AttributeName": "user_id", "AttributeType": "S" },
-    { "AttributeName": "email", "AttributeType": "S" }
-  ],
-  "GlobalSecondaryIndexes": [
-    {
-      "IndexName": "EmailIndex",
-      "KeySchema": [
-        { "AttributeName": "email", "KeyType": "HASH" }
-      ],
-      "Projection": { "ProjectionType": "ALL" }
-    }
-  ]
-}
-                ''', language='json')
         
-        with col2:
-            st.image("https://d1.awsstatic.com/product-page-diagram_Amazon-DynamoDBa.1f8742b4f5bfb8cd41a3d4d2d7c5286aac97d9ff.png",
-                    caption="How Amazon DynamoDB Works")
-            
-            st.markdown("#### Common DynamoDB Use Cases")
-            use_cases = [
-                "Mobile and web applications",
-                "Gaming applications",
-                "Digital ad serving",
-                "Live voting",
-                "E-commerce shopping carts"
-            ]
-            
-            for use_case in use_cases:
-                st.markdown(f"- {use_case}")
-        
-        # Other database services
-        st.markdown("---")
-        st.subheader("Other Database Services")
-        
-        other_dbs = {
-            "Service": ["Amazon Aurora", "Amazon ElastiCache", "Amazon Neptune", "Amazon DocumentDB", "Amazon Keyspaces", "Amazon MemoryDB"],
-            "Type": [
-                "Relational", "In-Memory", "Graph", "Document", "Wide Column", "In-Memory"
-            ],
-            "Description": [
-                "MySQL/PostgreSQL-compatible relational database with up to 5x performance",
-                "Fully managed Redis or Memcached for in-memory caching",
-                "Fully managed graph database service for connected datasets",
-                "MongoDB-compatible document database service",
-                "Apache Cassandra-compatible wide column database",
-                "Redis-compatible, durable in-memory database"
-            ]
-        }
-        
-        df = pd.DataFrame(other_dbs)
-        st.table(df)
+        with st.expander("Sample DynamoDB Table Structure"):
+            st.code(DYNAMODB_SAMPLE_JSON, language='json')
     
-    with service_tabs[3]:
-        st.markdown("### AWS Networking Services")
-        st.markdown("""
+    with col2:
+        show_diagram("dynamodb")
+        
+        st.markdown("#### Common DynamoDB Use Cases")
+        use_cases = [
+            "Mobile and web applications",
+            "Gaming applications",
+            "Digital ad serving",
+            "Live voting",
+            "E-commerce shopping carts"
+        ]
+        
+        st.markdown("\n".join(f"- {use_case}" for use_case in use_cases))
+    
+    # Other database services
+    st.markdown("---")
+    st.markdown(_section_html("other_databases"), unsafe_allow_html=True)
+
+def _render_networking():
+    st.markdown("""
+        ### AWS Networking Services
+        
         AWS networking services enable you to isolate cloud infrastructure, scale resource delivery, and connect data centers.
         """)
-        
-        # VPC section
-        st.subheader("Amazon VPC (Virtual Private Cloud)")
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            st.markdown("""
+    
+    # VPC section
+    st.subheader("Amazon VPC (Virtual Private Cloud)")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        st.markdown("""
             Amazon VPC lets you provision a logically isolated section of the AWS Cloud where you can launch AWS resources 
             in a virtual network that you define.
             
@@ -959,59 +1154,59 @@ def lambda_handler(event, context):
             - Multiple connectivity options
             - Custom network configurations
             """)
-            
-            with st.expander("VPC Components"):
-                components = [
-                    "**Subnets**: Range of IP addresses in your VPC (public or private)",
-                    "**Route Tables**: Set of rules (routes) to direct network traffic",
-                    "**Internet Gateway**: Connects VPC to the internet",
-                    "**NAT Gateway**: Enables internet access for private subnets",
-                    "**Security Groups**: Virtual firewall at the instance level",
-                    "**Network ACLs**: Virtual firewall at the subnet level",
-                    "**VPC Endpoints**: Connect to AWS services privately"
-                ]
-                
-                for component in components:
-                    st.markdown(f"- {component}")
-        
-        with col2:
-            st.image("https://d1.awsstatic.com/Digital%20Marketing/House/1up/products/VPC/Product-Page-Diagram_Amazon-VPC_Basic-VPC.e05a31086b7591a144088d0ce38b479551903329.png",
-                    caption="Amazon VPC Architecture")
         
-        # Security Groups vs NACLs
-        st.markdown("---")
-        st.subheader("Security Groups vs. Network ACLs")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### Security Groups")
-            st.markdown("""
+        with st.expander("VPC Components"):
+            components = [
+                "**Subnets**: Range of IP addresses in your VPC (public or private)",
+                "**Route Tables**: Set of rules (routes) to direct network traffic",
+                "**Internet Gateway**: Connects VPC to the internet",
+                "**NAT Gateway**: Enables internet access for private subnets",
+                "**Security Groups**: Virtual firewall at the instance level",
+                "**Network ACLs**: Virtual firewall at the subnet level",
+                "**VPC Endpoints**: Connect to AWS services privately"
+            ]
+            
+            st.markdown("\n".join(f"- {component}" for component in components))
+    
+    with col2:
+        show_diagram("vpc")
+    
+    # Security Groups vs NACLs
+    st.markdown("---")
+    st.subheader("Security Groups vs. Network ACLs")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+            #### Security Groups
+            
             - Acts as a virtual firewall for EC2 instances
             - Controls inbound and outbound traffic at the instance level
             - Stateful: Return traffic automatically allowed
             - Allow rules only (no explicit deny)
             - Evaluated as a whole before traffic is allowed
             """)
-        
-        with col2:
-            st.markdown("#### Network ACLs")
-            st.markdown("""
+    
+    with col2:
+        st.markdown("""
+            #### Network ACLs
+            
             - Acts as a firewall for subnets
             - Controls inbound and outbound traffic at the subnet level
             - Stateless: Return traffic must be explicitly allowed
             - Both allow and deny rules
             - Rules processed in order, starting with lowest numbered rule
             """)
-        
-        # Route 53 section
-        st.markdown("---")
-        st.subheader("Amazon Route 53")
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            st.markdown("""
+    
+    # Route 53 section
+    st.markdown("---")
+    st.subheader("Amazon Route 53")
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        st.markdown("""
             Amazon Route 53 is a highly available and scalable Domain Name System (DNS) web service. Route 53 connects user 
             requests to infrastructure running in AWS and can also route users to infrastructure outside of AWS.
             
@@ -1023,355 +1218,222 @@ def lambda_handler(event, context):
             - Latency-based routing
             - Geo DNS
             """)
-            
-            with st.expander("Route 53 Routing Policies"):
-                policies = {
-                    "Policy": ["Simple", "Weighted", "Latency-based", "Failover", "Geolocation", "Multivalue Answer"],
-                    "Use Case": [
-                        "Single resource serving content",
-                        "Distribute traffic across multiple resources",
-                        "Route users to the lowest-latency endpoint",
-                        "Active-passive failover configuration",
-                        "Route traffic based on user location",
-                        "Respond with multiple healthy records selected randomly"
-                    ]
-                }
-                
-                df = pd.DataFrame(policies)
-                st.table(df)
-        
-        with col2:
-            st.image("https://d1.awsstatic.com/Route53/product-page-diagram_Amazon-Route-53_HIW%402x.4c2af00405a0825f83fcc6b3497ffaee6981be53.png",
-                    caption="How Route 53 Works")
-        
-        # Other networking services
-        st.markdown("---")
-        st.subheader("Other Networking Services")
         
-        other_networking = {
-            "Service": ["AWS Direct Connect", "Elastic Load Balancing", "Amazon CloudFront", "AWS Transit Gateway", "AWS Global Accelerator"],
-            "Description": [
-                "Dedicated network connection from on-premises to AWS",
-                "Distributes incoming application traffic across multiple targets",
-                "Global content delivery network (CDN) service",
-                "Centrally manage connectivity between VPCs and on-premises networks",
-                "Improve availability and performance of applications with global users"
-            ]
-        }
-        
-        df = pd.DataFrame(other_networking)
-        st.table(df)
+        with st.expander("Route 53 Routing Policies"):
+            st.table(_policies_df())
     
-    with service_tabs[4]:
-        st.markdown("### Other Key AWS Services")
-        
-        # Management & Governance
-        st.subheader("Management & Governance")
-        
-        mgmt_services = {
-            "Service": ["AWS CloudFormation", "AWS CloudTrail", "Amazon CloudWatch", "AWS Config", "AWS Systems Manager"],
-            "Description": [
-                "Create and manage resources with templates (Infrastructure as Code)",
-                "Track user activity and API usage for compliance and audit",
-                "Monitor resources and applications with metrics, logs, and alarms",
-                "Assess, audit, and evaluate configurations of resources",
-                "Operational insights and actions across resources"
-            ]
-        }
-        
-        df = pd.DataFrame(mgmt_services)
-        st.table(df)
-        
-        # Security & Identity
-        st.markdown("---")
-        st.subheader("Security, Identity & Compliance")
-        
-        security_services = {
-            "Service": ["AWS Identity and Access Management (IAM)", "Amazon Cognito", "AWS Shield", "AWS WAF", "Amazon GuardDuty"],
-            "Description": [
-                "Securely control access to AWS services and resources",
-                "Add user sign-up, sign-in, and access control to apps",
-                "DDoS protection service for applications",
-                "Web application firewall to protect against common exploits",
-                "Intelligent threat detection service"
-            ]
-        }
-        
-        df = pd.DataFrame(security_services)
-        st.table(df)
-        
-        # Application Integration
-        st.markdown("---")
-        st.subheader("Application Integration")
-        
-        integration_services = {
-            "Service": ["Amazon SQS", "Amazon SNS", "AWS Step Functions", "Amazon EventBridge", "Amazon MQ"],
-            "Description": [
-                "Fully managed message queuing service",
-                "Fully managed pub/sub messaging service",
-                "Coordinate components of distributed applications",
-                "Serverless event bus for applications",
-                "Managed message broker service for ActiveMQ and RabbitMQ"
-            ]
-        }
-        
-        df = pd.DataFrame(integration_services)
-        st.table(df)
-        
-        # Machine Learning
-        st.markdown("---")
-        st.subheader("Machine Learning")
-        
-        ml_services = {
-            "Service": ["Amazon SageMaker", "Amazon Rekognition", "Amazon Transcribe", "Amazon Comprehend", "Amazon Lex"],
-            "Description": [
-                "Build, train, and deploy machine learning models",
-                "Add image and video analysis to applications",
-                "Convert speech to text",
-                "Natural language processing service",
-                "Build conversational interfaces (chatbots)"
-            ]
-        }
-        
-        df = pd.DataFrame(ml_services)
-        st.table(df)
-        
-        # Developer Tools
-        st.markdown("---")
-        st.subheader("Developer Tools")
-        
-        dev_services = {
-            "Service": ["AWS CodeCommit", "AWS CodeBuild", "AWS CodeDeploy", "AWS CodePipeline", "AWS Cloud9"],
-            "Description": [
-                "Fully managed source control service",
-                "Compile source code, run tests, and produce packages",
-                "Automate code deployments to any instance",
-                "Continuous delivery service for fast updates",
-                "Cloud-based IDE for writing, running, and debugging code"
-            ]
-        }
-        
-        df = pd.DataFrame(dev_services)
-        st.table(df)
+    with col2:
+        show_diagram("route53")
+    
+    # Other networking services
+    st.markdown("---")
+    st.markdown(_section_html("other_networking"), unsafe_allow_html=True)
+
+def _render_other_services():
+    st.markdown(_section_html("other_services"), unsafe_allow_html=True)
+
+# AWS Services Content
+@st.fragment
+def show_aws_services():
+    st.title("Introduction to AWS Services")
+    
+    # Create tabs for different service categories
+    render_lazy_tabs({
+        "Compute": _render_compute,
+        "Storage": _render_storage,
+        "Database": _render_database,
+        "Networking": _render_networking,
+        "Other Key Services": _render_other_services,
+    }, key="service_tabs")
 
 # Knowledge Check Content
+# Knowledge check questions - shared by the quiz and the results page
+QUESTIONS = (
+    {
+        "question": "Which of the following is an advantage of cloud computing?",
+        "options": (
+            "Trade variable expense for fixed expense",
+            "Benefit from massive economies of scale",
+            "Stop guessing capacity",
+            "Increase spending on data center operations"
+        ),
+        "answer": 1,
+        "explanation": "One of the main advantages of cloud computing is benefiting from massive economies of scale. When hundreds of thousands of customers aggregate in the cloud, AWS can achieve higher economies of scale, which translates into lower pay-as-you-go prices."
+    },
+    {
+        "question": "Which of these is an example of an AWS Region?",
+        "options": (
+            "us-east-1",
+            "us-east-1a",
+            "North America",
+            "Edge Location"
+        ),
+        "answer": 0,
+        "explanation": "us-east-1 (N. Virginia) is an example of an AWS Region. Regions are geographic areas where AWS clusters data centers. us-east-1a would be an example of an Availability Zone within a Region."
+    },
+    {
+        "question": "What is the durability percentage that Amazon S3 Standard storage class is designed to provide?",
+        "options": (
+            "99.9%",
+            "99.99%",
+            "99.999999999% (9 9's)",
+            "99.999999999% (11 9's)"
+        ),
+        "answer": 3,
+        "explanation": "Amazon S3 Standard is designed to provide 99.999999999% (11 9's) of durability over a given year. This is one of the highest durability levels available in storage systems."
+    },
+    {
+        "question": "Which AWS service is a compute service that lets you run code without provisioning or managing servers?",
+        "options": (
+            "Amazon EC2",
+            "AWS Lambda",
+            "Amazon ECS",
+            "AWS Fargate"
+        ),
+        "answer": 1,
+        "explanation": "AWS Lambda is a serverless compute service that runs your code in response to events and automatically manages the computing resources for you, eliminating the need to provision or manage servers."
+    },
+    {
+        "question": "Which of the following statements about AWS Availability Zones is true? (Select all that apply)",
+        "options": (
+            "They are located in different cities within a country",
+            "They are physically separated facilities within a Region",
+            "They are connected with high bandwidth, low latency networking",
+            "All AWS services automatically replicate data across multiple Availability Zones"
+        ),
+        "answer": (1, 2),
+        "type": "multiple",
+        "explanation": "Availability Zones are physically separated facilities within an AWS Region, and they are connected via high bandwidth, low latency networking. However, they are typically in the same metropolitan area (not different cities), and not all AWS services automatically replicate data across multiple Availability Zones."
+    }
+)
+
+QUESTION_COUNT = len(QUESTIONS)
+
+# Answer keys derived once from QUESTIONS - a frozenset for multi-select questions,
+# the option index otherwise, plus the correct option labels for the results page
+CORRECT_SETS = tuple(
+    frozenset(q["answer"]) if q.get("type") == "multiple" else q["answer"]
+    for q in QUESTIONS
+)
+CORRECT_LABELS = tuple(
+    ", ".join(q["options"][j] for j in (q["answer"] if q.get("type") == "multiple" else (q["answer"],)))
+    for q in QUESTIONS
+)
+
+# Knowledge check navigation - callbacks update state before the rerun they trigger
+def _restart_knowledge_check():
+    st.session_state['knowledge_check_progress'] = 0
+    st.session_state['knowledge_check_answers'] = [None] * QUESTION_COUNT
+    st.session_state['knowledge_check_results'] = False
+
+def _show_knowledge_check_results():
+    st.session_state['knowledge_check_results'] = True
+
+def _previous_question():
+    st.session_state['knowledge_check_progress'] -= 1
+
+def _next_question():
+    st.session_state['knowledge_check_progress'] += 1
+
+# Quiz question renderers - each question type gets its own renderer so the
+# type check happens once at import instead of on every rerun
+def _render_single_question(idx):
+    q = QUESTIONS[idx]
+    st.subheader(f"Question {idx + 1} of {QUESTION_COUNT}")
+    st.markdown(f"**{q['question']}**")
+    
+    options = q["options"]
+    answer = st.radio("Select your answer:", options, key=f"q{idx}")
+    st.session_state['knowledge_check_answers'][idx] = options.index(answer)
+
+def _render_multi_question(idx):
+    q = QUESTIONS[idx]
+    st.subheader(f"Question {idx + 1} of {QUESTION_COUNT}")
+    st.markdown(f"**{q['question']}**")
+    
+    options = q["options"]
+    selected_labels = st.multiselect("Select all that apply:", options, key=f"q{idx}_ms")
+    st.session_state['knowledge_check_answers'][idx] = [options.index(label) for label in selected_labels]
+
+# Question index -> bound renderer, built once so the quiz dispatches by index
+_QUESTION_RENDERERS = tuple(
+    partial(_render_multi_question if q.get("type") == "multiple" else _render_single_question, i)
+    for i, q in enumerate(QUESTIONS)
+)
+
+@st.fragment
 def show_knowledge_check():
     st.title("Knowledge Check")
     
+    # Quiz state is seeded by initialize_session(); read it once per run
+    ss = st.session_state
+    current_q = ss['knowledge_check_progress']
+    show_results_page = ss['knowledge_check_results']
+    
     # Display progress
-    st.progress(st.session_state['knowledge_check_progress'] / 5)
+    st.progress(current_q / QUESTION_COUNT)
     
     # Button to restart knowledge check
-    if st.button("Restart Knowledge Check"):
-        st.session_state['knowledge_check_progress'] = 0
-        st.session_state['knowledge_check_answers'] = {}
-        st.session_state['knowledge_check_results'] = False
-        st.experimental_rerun()
+    st.button("Restart Knowledge Check", on_click=_restart_knowledge_check)
     
     # Show results button
-    if st.session_state['knowledge_check_progress'] == 5 and not st.session_state['knowledge_check_results']:
-        if st.button("Show Results"):
-            st.session_state['knowledge_check_results'] = True
-            st.experimental_rerun()
+    if current_q == QUESTION_COUNT and not show_results_page:
+        st.button("Show Results", on_click=_show_knowledge_check_results)
     
     # Display results if complete
-    if st.session_state['knowledge_check_results']:
+    if show_results_page:
         show_results()
         return
     
-    # Setup questions
-    questions = [
-        {
-            "question": "Which of the following is an advantage of cloud computing?",
-            "options": [
-                "Trade variable expense for fixed expense",
-                "Benefit from massive economies of scale",
-                "Stop guessing capacity",
-                "Increase spending on data center operations"
-            ],
-            "answer": 1,
-            "explanation": "One of the main advantages of cloud computing is benefiting from massive economies of scale. When hundreds of thousands of customers aggregate in the cloud, AWS can achieve higher economies of scale, which translates into lower pay-as-you-go prices."
-        },
-        {
-            "question": "Which of these is an example of an AWS Region?",
-            "options": [
-                "us-east-1",
-                "us-east-1a",
-                "North America",
-                "Edge Location"
-            ],
-            "answer": 0,
-            "explanation": "us-east-1 (N. Virginia) is an example of an AWS Region. Regions are geographic areas where AWS clusters data centers. us-east-1a would be an example of an Availability Zone within a Region."
-        },
-        {
-            "question": "What is the durability percentage that Amazon S3 Standard storage class is designed to provide?",
-            "options": [
-                "99.9%",
-                "99.99%",
-                "99.999999999% (9 9's)",
-                "99.999999999% (11 9's)"
-            ],
-            "answer": 3,
-            "explanation": "Amazon S3 Standard is designed to provide 99.999999999% (11 9's) of durability over a given year. This is one of the highest durability levels available in storage systems."
-        },
-        {
-            "question": "Which AWS service is a compute service that lets you run code without provisioning or managing servers?",
-            "options": [
-                "Amazon EC2",
-                "AWS Lambda",
-                "Amazon ECS",
-                "AWS Fargate"
-            ],
-            "answer": 1,
-            "explanation": "AWS Lambda is a serverless compute service that runs your code in response to events and automatically manages the computing resources for you, eliminating the need to provision or manage servers."
-        },
-        {
-            "question": "Which of the following statements about AWS Availability Zones is true? (Select all that apply)",
-            "options": [
-                "They are located in different cities within a country",
-                "They are physically separated facilities within a Region",
-                "They are connected with high bandwidth, low latency networking",
-                "All AWS services automatically replicate data across multiple Availability Zones"
-            ],
-            "answer": [1, 2],
-            "type": "multiple",
-            "explanation": "Availability Zones are physically separated facilities within an AWS Region, and they are connected via high bandwidth, low latency networking. However, they are typically in the same metropolitan area (not different cities), and not all AWS services automatically replicate data across multiple Availability Zones."
-        }
-    ]
-    
     # Display current question
-    current_q = st.session_state['knowledge_check_progress']
-    
-    if current_q < len(questions):
-        q = questions[current_q]
-        st.subheader(f"Question {current_q + 1} of {len(questions)}")
-        st.markdown(f"**{q['question']}**")
-        
-        # Handle radio button or checkbox based on question type
-        if q.get("type") == "multiple":
-            options = q["options"]
-            # Initialize answer in session state if not present
-            if f"q{current_q}" not in st.session_state['knowledge_check_answers']:
-                st.session_state['knowledge_check_answers'][f"q{current_q}"] = []
-            
-            # Display checkboxes
-            selected = []
-            for i, option in enumerate(options):
-                if st.checkbox(option, key=f"q{current_q}_option{i}"):
-                    selected.append(i)
-            
-            st.session_state['knowledge_check_answers'][f"q{current_q}"] = selected
-        else:
-            options = q["options"]
-            # Initialize answer in session state if not present
-            if f"q{current_q}" not in st.session_state['knowledge_check_answers']:
-                st.session_state['knowledge_check_answers'][f"q{current_q}"] = None
-            
-            # Display radio buttons
-            answer = st.radio("Select your answer:", options, key=f"q{current_q}")
-            st.session_state['knowledge_check_answers'][f"q{current_q}"] = options.index(answer)
+    if current_q < QUESTION_COUNT:
+        _QUESTION_RENDERERS[current_q]()
         
         # Navigation buttons
         col1, col2 = st.columns(2)
         
         with col1:
             if current_q > 0:
-                if st.button("Previous"):
-                    st.session_state['knowledge_check_progress'] -= 1
-                    st.experimental_rerun()
+                st.button("Previous", on_click=_previous_question)
         
         with col2:
-            if st.button("Next"):
-                st.session_state['knowledge_check_progress'] += 1
-                st.experimental_rerun()
+            st.button("Next", on_click=_next_question)
+
+# Quiz answer graders - return (is_correct, answer label) for one question,
+# specialized by question type like the renderers above
+def _grade_single_answer(idx, user_answer):
+    if user_answer is None:
+        return False, 'No selection'
+    return user_answer == CORRECT_SETS[idx], QUESTIONS[idx]['options'][user_answer]
+
+def _grade_multi_answer(idx, user_answer):
+    if not user_answer:
+        return False, 'No selection'
+    options = QUESTIONS[idx]['options']
+    return frozenset(user_answer) == CORRECT_SETS[idx], ', '.join(options[j] for j in user_answer)
+
+_ANSWER_GRADERS = tuple(
+    partial(_grade_multi_answer if q.get("type") == "multiple" else _grade_single_answer, i)
+    for i, q in enumerate(QUESTIONS)
+)
 
 def show_results():
     st.subheader("Knowledge Check Results")
     
-    questions = [
-        {
-            "question": "Which of the following is an advantage of cloud computing?",
-            "options": [
-                "Trade variable expense for fixed expense",
-                "Benefit from massive economies of scale",
-                "Stop guessing capacity",
-                "Increase spending on data center operations"
-            ],
-            "answer": 1,
-            "explanation": "One of the main advantages of cloud computing is benefiting from massive economies of scale. When hundreds of thousands of customers aggregate in the cloud, AWS can achieve higher economies of scale, which translates into lower pay-as-you-go prices."
-        },
-        {
-            "question": "Which of these is an example of an AWS Region?",
-            "options": [
-                "us-east-1",
-                "us-east-1a",
-                "North America",
-                "Edge Location"
-            ],
-            "answer": 0,
-            "explanation": "us-east-1 (N. Virginia) is an example of an AWS Region. Regions are geographic areas where AWS clusters data centers. us-east-1a would be an example of an Availability Zone within a Region."
-        },
-        {
-            "question": "What is the durability percentage that Amazon S3 Standard storage class is designed to provide?",
-            "options": [
-                "99.9%",
-                "99.99%",
-                "99.999999999% (9 9's)",
-                "99.999999999% (11 9's)"
-            ],
-            "answer": 3,
-            "explanation": "Amazon S3 Standard is designed to provide 99.999999999% (11 9's) of durability over a given year. This is one of the highest durability levels available in storage systems."
-        },
-        {
-            "question": "Which AWS service is a compute service that lets you run code without provisioning or managing servers?",
-            "options": [
-                "Amazon EC2",
-                "AWS Lambda",
-                "Amazon ECS",
-                "AWS Fargate"
-            ],
-            "answer": 1,
-            "explanation": "AWS Lambda is a serverless compute service that runs your code in response to events and automatically manages the computing resources for you, eliminating the need to provision or manage servers."
-        },
-        {
-            "question": "Which of the following statements about AWS Availability Zones is true? (Select all that apply)",
-            "options": [
-                "They are located in different cities within a country",
-                "They are physically separated facilities within a Region",
-                "They are connected with high bandwidth, low latency networking",
-                "All AWS services automatically replicate data across multiple Availability Zones"
-            ],
-            "answer": [1, 2],
-            "type": "multiple",
-            "explanation": "Availability Zones are physically separated facilities within an AWS Region, and they are connected via high bandwidth, low latency networking. However, they are typically in the same metropolitan area (not different cities), and not all AWS services automatically replicate data across multiple Availability Zones."
-        }
-    ]
+    questions = QUESTIONS
     
     correct = 0
-    total = len(questions)
+    total = QUESTION_COUNT
     
     for i, q in enumerate(questions):
-        user_answer = st.session_state['knowledge_check_answers'].get(f"q{i}")
-        
-        if q.get("type") == "multiple":
-            is_correct = sorted(user_answer) == sorted(q["answer"]) if user_answer else False
-        else:
-            is_correct = user_answer == q["answer"] if user_answer is not None else False
+        is_correct, answer_label = _ANSWER_GRADERS[i](st.session_state['knowledge_check_answers'][i])
         
         if is_correct:
             correct += 1
         
-        if q.get("type") == "multiple":
-            selected_options = [q["options"][j] for j in user_answer] if user_answer else []
-            correct_options = [q["options"][j] for j in q["answer"]]
-            
-            st.markdown(f"### Question {i + 1}: {q['question']}")
-            st.markdown(f"**Your answer:** {', '.join(selected_options) if selected_options else 'No selection'}")
-            st.markdown(f"**Correct answer:** {', '.join(correct_options)}")
-        else:
-            st.markdown(f"### Question {i + 1}: {q['question']}")
-            st.markdown(f"**Your answer:** {q['options'][user_answer] if user_answer is not None else 'No selection'}")
-            st.markdown(f"**Correct answer:** {q['options'][q['answer']]}")
+        st.markdown(f"### Question {i + 1}: {q['question']}")
+        st.markdown(f"**Your answer:** {answer_label}")
+        st.markdown(f"**Correct answer:** {CORRECT_LABELS[i]}")
         
         if is_correct:
             st.success("Correct! ✓")
@@ -1385,11 +1447,16 @@ def show_results():
     st.subheader(f"Final Score: {correct}/{total} ({int(correct/total*100)}%)")
     
     # Restart button
-    if st.button("Try Again"):
-        st.session_state['knowledge_check_progress'] = 0
-        st.session_state['knowledge_check_answers'] = {}
-        st.session_state['knowledge_check_results'] = False
-        st.experimental_rerun()
+    st.button("Try Again", on_click=_restart_knowledge_check)
+
+# Section selector label -> render function
+SECTIONS = {
+    "🏠 Home": show_home,
+    "💰 Value Proposition": show_value_proposition,
+    "🌎 Global Infrastructure": show_global_infrastructure,
+    "🛠️ AWS Services": show_aws_services,
+    "📝 Knowledge Check": show_knowledge_check,
+}
 
 # Main application
 def main():
@@ -1404,7 +1471,7 @@ def main():
         # Render the sidebar
         common.render_sidebar()
 
-        st.image("https://d1.awsstatic.com/training-and-certification/certification-badges/AWS-Certified-Cloud-Practitioner_badge.634f8a21af2e0e956ed8905a72366146ba22b74c.png", width=150)
+        st.image(load_image(BADGE_URL), width=150)
         st.markdown("## AWS Cloud Practitioner")
         st.markdown("### Content Review Session 1")
         
@@ -1429,23 +1496,8 @@ def main():
         
         # st.markdown(f"**Session ID:** {st.session_state['session_id'][:8]}...")
     
-    # Main content tabs
-    tabs = st.tabs(["🏠 Home", "💰 Value Proposition", "🌎 Global Infrastructure", "🛠️ AWS Services", "📝 Knowledge Check"])
-    
-    with tabs[0]:
-        show_home()
-    
-    with tabs[1]:
-        show_value_proposition()
-    
-    with tabs[2]:
-        show_global_infrastructure()
-    
-    with tabs[3]:
-        show_aws_services()
-    
-    with tabs[4]:
-        show_knowledge_check()
+    # Main content sections - only the selected section is executed on each rerun
+    render_lazy_tabs(SECTIONS, key="main_section")
     
     # Footer
     st.markdown("""
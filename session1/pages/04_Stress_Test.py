@@ -1,20 +1,93 @@
 import streamlit as st
 import boto3
-import json
-import time
+from botocore.config import Config
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from time import localtime, strftime
 import utils.authenticate as authenticate
 import utils.common as common
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging once - the page script is re-executed on every rerun
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
 logger = logging.getLogger(__name__)
 
-def send_stress_command(target_tag_name, target_tag_value, stress_duration):
+# Regions offered in the region selector
+_AWS_REGIONS = (
+    "us-east-1", "us-east-2", "us-west-1", "us-west-2",
+    "eu-west-1", "eu-west-2", "eu-west-3", "eu-central-1",
+    "ap-northeast-1", "ap-northeast-2", "ap-southeast-1", "ap-southeast-2",
+    "sa-east-1", "ca-central-1"
+)
+
+# Number of output characters kept per plugin for the status panel
+_OUTPUT_PREVIEW_CHARS = 500
+
+# Sidebar "About this Application" text
+_ABOUT_MD = """
+        This application uses AWS Systems Manager (SSM) to send stress test commands to EC2 instances.
+        
+        You can target instances by tag and apply CPU stress using the stress-ng tool to simulate 
+        high load scenarios. This helps test auto-scaling policies, monitor system performance,
+        and validate application behavior under load.
+        """
+
+# "Usage Instructions" text, including the stress-ng install commands
+_HELP_MD = """
+        This application uses AWS Systems Manager (SSM) to send stress test commands to EC2 instances.
+        
+        The stress test uses the `stress-ng` tool with the `--matrix` parameter which performs 
+        matrix operations to stress the CPU.
+        
+        You can stop the stress test at any time using the "Stop Stress Test Command" button,
+        which will kill all stress-ng processes on the target instances.
+        
+        Make sure the target EC2 instances:
+        1. Have the SSM agent installed and running
+        2. Have the proper IAM permissions for SSM
+        3. Have the stress-ng tool installed
+        
+        To install stress-ng on Amazon Linux:
+        ```
+        sudo amazon-linux-extras install epel -y
+        sudo yum install stress-ng -y
+        ```
+        
+        To install on Ubuntu:
+        ```
+        sudo apt update
+        sudo apt install -y stress-ng
+        ```
+        """
+
+# Connection pool and retry settings shared by every SSM client
+_SSM_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 5}
+)
+
+@st.cache_resource(show_spinner=False)
+def get_ssm_client(region):
+    """
+    Get the shared SSM client for a region.
+    
+    Clients are thread-safe, so one client per region is built once and reused
+    across reruns and sessions instead of being created for every command.
+    Sessions are not, so each client gets its own short-lived session rather
+    than sharing one across the script threads of concurrent users.
+    
+    Args:
+        region (str): The AWS region the client talks to
+    
+    Returns:
+        botocore.client.SSM: SSM client for the region
+    """
+    return boto3.session.Session().client('ssm', region_name=region, config=_SSM_CLIENT_CONFIG)
+
+def send_stress_command(target_tag_name, target_tag_value, stress_duration, region):
     """
     Send stress-ng command to EC2 instances with specified tag.
     
@@ -22,15 +95,17 @@ def send_stress_command(target_tag_name, target_tag_value, stress_duration):
         target_tag_name (str): The name of the EC2 tag to target
         target_tag_value (str): The value of the tag to match
         stress_duration (int): Duration in minutes for the stress test
+        region (str): The AWS region of the target instances
     
     Returns:
         tuple: (bool, str) - Success status and command ID or error message
     """
     try:
-        # Initialize AWS SSM client
-        ssm_client = st.session_state.boto3_session.client('ssm')
+        # Get the shared AWS SSM client
+        ssm_client = get_ssm_client(region)
         
-        # Format the stress command with the specified duration
+        # Format the stress command with the specified duration; stress-ng exits on its
+        # own after the timeout, so a stop command is only needed to abort early
         stress_command = f"stress-ng --matrix 0 -t {stress_duration}m"
         logger.info(f"Preparing stress command: {stress_command}")
         
@@ -58,20 +133,21 @@ def send_stress_command(target_tag_name, target_tag_value, stress_duration):
         logger.error(f"Error sending stress command: {str(e)}")
         return False, str(e)
 
-def stop_stress_command(target_tag_name, target_tag_value):
+def stop_stress_command(target_tag_name, target_tag_value, region):
     """
     Send command to stop stress-ng processes on EC2 instances with specified tag.
     
     Args:
         target_tag_name (str): The name of the EC2 tag to target
         target_tag_value (str): The value of the tag to match
+        region (str): The AWS region of the target instances
     
     Returns:
         tuple: (bool, str) - Success status and command ID or error message
     """
     try:
-        # Initialize AWS SSM client
-        ssm_client = st.session_state.boto3_session.client('ssm')
+        # Get the shared AWS SSM client
+        ssm_client = get_ssm_client(region)
         
         # Command to kill stress-ng processes
         stop_command = "pkill stress-ng"
@@ -101,61 +177,128 @@ def stop_stress_command(target_tag_name, target_tag_value):
         logger.error(f"Error sending stop stress command: {str(e)}")
         return False, str(e)
 
-def get_command_status(command_id):
+def fetch_command_status(ssm_client, command_id, include_output=False):
     """
-    Get the status of a command execution.
+    Fetch the status of a command execution from SSM.
+    
+    Only the fields the status panel renders are kept, so the full response is
+    not retained in the cache. This makes no Streamlit calls, so it is safe to
+    run on worker threads.
     
     Args:
+        ssm_client (botocore.client.SSM): Client for the region the command was sent to
         command_id (str): The SSM command ID to check
+        include_output (bool): Also fetch per-plugin output, which can be large
         
     Returns:
-        dict or str: Command status information or error message
+        list or str: (instance_id, status, outputs) tuple per invocation, where
+            outputs holds (output_head, truncated) per plugin, or error message
     """
     try:
-        ssm_client = st.session_state.boto3_session.client('ssm')
         response = ssm_client.list_command_invocations(
             CommandId=command_id,
-            Details=True
+            Details=include_output
         )
         logger.info(f"Successfully retrieved status for command ID: {command_id}")
-        return response
+        invocations = []
+        for invocation in response.get('CommandInvocations', []):
+            outputs = []
+            for plugin in invocation.get('CommandPlugins', []):
+                output = plugin.get('Output', 'No output available')
+                outputs.append((output[:_OUTPUT_PREVIEW_CHARS], len(output) > _OUTPUT_PREVIEW_CHARS))
+            invocations.append((invocation['InstanceId'], invocation['Status'], outputs))
+        return invocations
     except Exception as e:
         logger.error(f"Error retrieving command status: {str(e)}")
         return str(e)
 
-def display_command_status(command_id, command_time_label):
+@st.cache_data(ttl=5, show_spinner=False)
+def get_command_statuses(command_ids, region, include_output=False):
     """
-    Display the status of a command execution.
+    Get the status of one or more command executions concurrently.
+    
+    The SSM client is thread-safe, so the requests share it and the total wait
+    is the slowest request rather than the sum of all of them. The client is
+    looked up and the combined result cached on the script thread; the pool
+    threads only make the uncached SSM calls. Results are cached for a few
+    seconds so repeated status clicks and unrelated reruns do not call the SSM
+    API again.
+    
+    Args:
+        command_ids (tuple): The SSM command IDs to check
+        region (str): The AWS region the commands were sent to
+        include_output (bool): Also fetch per-plugin output, which can be large
+        
+    Returns:
+        list: Status information or error message for each command ID, in order
+    """
+    ssm_client = get_ssm_client(region)
+    if len(command_ids) == 1:
+        # Nothing to overlap, so skip the pool
+        return [fetch_command_status(ssm_client, command_ids[0], include_output)]
+    with ThreadPoolExecutor(max_workers=len(command_ids)) as executor:
+        return list(executor.map(
+            lambda command_id: fetch_command_status(ssm_client, command_id, include_output),
+            command_ids
+        ))
+
+def get_command_status(command_id, region, include_output=False):
+    """
+    Get the status of a single command execution.
     
     Args:
         command_id (str): The SSM command ID to check
+        region (str): The AWS region the command was sent to
+        include_output (bool): Also fetch per-plugin output, which can be large
+        
+    Returns:
+        list or str: Status information or error message, as for fetch_command_status
+    """
+    return get_command_statuses((command_id,), region, include_output)[0]
+
+def render_command_status(command_id, command_time_label, status_response):
+    """
+    Render a fetched command status.
+    
+    Args:
+        command_id (str): The SSM command ID that was checked
         command_time_label (str): Label for the command time to display
+        status_response (list or str): Result of get_command_status
     """
-    with st.spinner("Fetching command status..."):
-        status_response = get_command_status(command_id)
+    if isinstance(status_response, list):
+        st.write(f"Command ID: {command_id}")
+        st.write(f"Command sent at: {command_time_label}")
         
-        if isinstance(status_response, dict):
-            st.write(f"Command ID: {command_id}")
-            st.write(f"Command sent at: {command_time_label}")
+        # Create a table to display instance status
+        if status_response:
+            st.subheader("Target Instances")
             
-            # Create a table to display instance status
-            if 'CommandInvocations' in status_response and status_response['CommandInvocations']:
-                st.subheader("Target Instances")
+            for instance_id, status, outputs in status_response:
+                st.write(f"**Instance ID**: {instance_id}")
+                st.write(f"**Status**: {status}")
                 
-                for invocation in status_response['CommandInvocations']:
-                    st.write(f"**Instance ID**: {invocation['InstanceId']}")
-                    st.write(f"**Status**: {invocation['Status']}")
-                    
-                    if 'CommandPlugins' in invocation:
-                        for plugin in invocation['CommandPlugins']:
-                            output = plugin.get('Output', 'No output available')
-                            st.write(f"**Output**: {output[:500]}")
-                            if len(output) > 500:
-                                st.write("(Output truncated...)")
-            else:
-                st.warning("No instances have executed the command yet.")
+                for output_head, truncated in outputs:
+                    st.write(f"**Output**: {output_head}")
+                    if truncated:
+                        st.write("(Output truncated...)")
         else:
-            st.error(f"Failed to fetch status: {status_response}")
+            st.warning("No instances have executed the command yet.")
+    else:
+        st.error(f"Failed to fetch status: {status_response}")
+
+def display_command_status(command_id, command_time_label, region, include_output=False):
+    """
+    Display the status of a command execution.
+    
+    Args:
+        command_id (str): The SSM command ID to check
+        command_time_label (str): Label for the command time to display
+        region (str): The AWS region the command was sent to
+        include_output (bool): Also fetch and show per-plugin output
+    """
+    with st.spinner("Fetching command status..."):
+        status_response = get_command_status(command_id, region, include_output)
+    render_command_status(command_id, command_time_label, status_response)
 
 def init_session_state():
     """Initialize session state variables with default values if they don't exist."""
@@ -169,16 +312,15 @@ def init_session_state():
 def render_about_section():
     """Render the About section in the sidebar."""
     with st.sidebar.expander("About this Application", expanded=False):
-        st.write("""
-        This application uses AWS Systems Manager (SSM) to send stress test commands to EC2 instances.
-        
-        You can target instances by tag and apply CPU stress using the stress-ng tool to simulate 
-        high load scenarios. This helps test auto-scaling policies, monitor system performance,
-        and validate application behavior under load.
-        """)
+        st.markdown(_ABOUT_MD)
 
-def render_stress_test_form():
-    """Render the stress test parameters form."""
+def render_stress_test_form(region):
+    """
+    Render the stress test parameters form.
+    
+    Args:
+        region (str): The AWS region of the target instances
+    """
     with st.form("stress_test_form"):
         st.header("Stress Test Parameters")
         
@@ -198,18 +340,23 @@ def render_stress_test_form():
             st.session_state.tag_value = tag_value
             
             with st.spinner("Sending command..."):
-                success, command_result = send_stress_command(tag_name, tag_value, stress_duration)
+                success, command_result = send_stress_command(tag_name, tag_value, stress_duration, region)
                 
                 if success:
                     st.success(f"Command sent successfully! Command ID: {command_result}")
                     st.session_state.command_id = command_result
-                    st.session_state.command_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    st.session_state.command_time = strftime("%Y-%m-%d %H:%M:%S", localtime())
                     st.session_state.stress_active = True
                 else:
                     st.error(f"Failed to send command: {command_result}")
 
-def render_stop_button():
-    """Render the button to stop active stress test."""
+def render_stop_button(region):
+    """
+    Render the button to stop active stress test.
+    
+    Args:
+        region (str): The AWS region of the target instances
+    """
     if st.session_state.stress_active:
         st.markdown("---")
         st.subheader("Stop Stress Test")
@@ -218,68 +365,75 @@ def render_stop_button():
             with st.spinner("Stopping stress test..."):
                 success, command_result = stop_stress_command(
                     st.session_state.tag_name, 
-                    st.session_state.tag_value
+                    st.session_state.tag_value,
+                    region
                 )
                 
                 if success:
                     st.success(f"Stop command sent successfully! Command ID: {command_result}")
                     st.session_state.stop_command_id = command_result
-                    st.session_state.stop_command_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    st.session_state.stop_command_time = strftime("%Y-%m-%d %H:%M:%S", localtime())
                     st.session_state.stress_active = False
                 else:
                     st.error(f"Failed to send stop command: {command_result}")
 
-def render_command_monitoring():
-    """Render the command monitoring section."""
+def render_command_monitoring(region):
+    """
+    Render the command monitoring section.
+    
+    Args:
+        region (str): The AWS region the commands were sent to
+    """
     st.markdown("---")
     st.header("Command Monitoring")
 
+    # Command output can be large, so only request it when asked for
+    include_output = st.checkbox("Include command output", value=False)
+
+    # Status checks are cached briefly; Refresh forces the next check to call SSM
+    if st.button("Refresh Status"):
+        get_command_statuses.clear()
+        st.toast("Cached command status cleared.")
+
     # Two columns for checking different commands
     col1, col2 = st.columns(2)
 
     with col1:
         if st.button("Check Status of Last Start Command"):
             if 'command_id' in st.session_state:
-                display_command_status(st.session_state.command_id, st.session_state.command_time)
+                display_command_status(st.session_state.command_id, st.session_state.command_time, region, include_output)
             else:
                 st.warning("No start commands have been sent yet.")
 
     with col2:
         if st.button("Check Status of Last Stop Command"):
             if 'stop_command_id' in st.session_state:
-                display_command_status(st.session_state.stop_command_id, st.session_state.stop_command_time)
+                display_command_status(st.session_state.stop_command_id, st.session_state.stop_command_time, region, include_output)
             else:
                 st.warning("No stop commands have been sent yet.")
 
+    # Fetch both statuses in parallel and show them side by side
+    if st.button("Check Status of Both Commands", use_container_width=True):
+        if 'command_id' in st.session_state and 'stop_command_id' in st.session_state:
+            with st.spinner("Fetching command status..."):
+                start_status, stop_status = get_command_statuses(
+                    (st.session_state.command_id, st.session_state.stop_command_id),
+                    region,
+                    include_output
+                )
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                render_command_status(st.session_state.command_id, st.session_state.command_time, start_status)
+            with col2:
+                render_command_status(st.session_state.stop_command_id, st.session_state.stop_command_time, stop_status)
+        else:
+            st.warning("Send both a start and a stop command first.")
+
 def render_help_section():
     """Render the help information section."""
     with st.expander("Usage Instructions"):
-        st.write("""
-        This application uses AWS Systems Manager (SSM) to send stress test commands to EC2 instances.
-        
-        The stress test uses the `stress-ng` tool with the `--matrix` parameter which performs 
-        matrix operations to stress the CPU.
-        
-        You can stop the stress test at any time using the "Stop Stress Test Command" button,
-        which will kill all stress-ng processes on the target instances.
-        
-        Make sure the target EC2 instances:
-        1. Have the SSM agent installed and running
-        2. Have the proper IAM permissions for SSM
-        3. Have the stress-ng tool installed
-        
-        To install stress-ng on Amazon Linux:
-        ```
-        sudo amazon-linux-extras install epel -y
-        sudo yum install stress-ng -y
-        ```
-        
-        To install on Ubuntu:
-        ```
-        sudo apt update
-        sudo apt install -y stress-ng
-        ```
-        """)
+        st.markdown(_HELP_MD)
 
 def render_sidebar():
    
@@ -300,23 +454,7 @@ def render_sidebar():
 
 def render_region_selector():
     """Render the AWS region selector."""
-    aws_regions = [
-        "us-east-1", "us-east-2", "us-west-1", "us-west-2",
-        "eu-west-1", "eu-west-2", "eu-west-3", "eu-central-1",
-        "ap-northeast-1", "ap-northeast-2", "ap-southeast-1", "ap-southeast-2",
-        "sa-east-1", "ca-central-1"
-    ]
-    selected_region = st.selectbox("Select AWS Region", aws_regions)
-    
-    # Create session with selected region
-    try:
-        st.session_state.boto3_session = boto3.Session(region_name=selected_region)
-        logger.info(f"Successfully created boto3 session for region: {selected_region}")
-    except Exception as e:
-        logger.error(f"Error creating boto3 session: {str(e)}")
-        st.error(f"Error setting AWS region: {str(e)}")
-
-    return selected_region
+    return st.selectbox("Select AWS Region", _AWS_REGIONS)
 
 def main():
     """Main application function."""
@@ -338,12 +476,12 @@ def main():
         
         render_sidebar()
         # Render the region selector
-        render_region_selector()
+        region = render_region_selector()
         
         # Render the main interface sections
-        render_stress_test_form()
-        render_stop_button()
-        render_command_monitoring()
+        render_stress_test_form(region)
+        render_stop_button(region)
+        render_command_monitoring(region)
         render_help_section()
         
         # Add footer
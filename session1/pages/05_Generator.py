@@ -7,67 +7,122 @@ and sends it to a REST endpoint. It simulates a point-of-sale system
 generating sales records in real-time.
 """
 
+import bisect
 import json
 import logging
-import queue
+import os
 import random
 import threading
 import time
-import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from itertools import accumulate, islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import streamlit as st
-from faker import Faker
+from faker.providers.person.en_US import Provider as PersonProvider
 
 import utils.authenticate as authenticate
 import utils.common as common
 
+# Configure logging once - the page script is re-executed on every rerun
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+_LOGGER = logging.getLogger('coffee_sales_generator')
+
 # ----------------------
 # Configuration Constants
 # ----------------------
 
-COFFEE_TYPES = ["Flat White", "Americano", "Macchiato", "Cappuccino", "Latte", "Mocha", "Cold Brew"]
-MILK_TYPES = ["Full Cream", "Skinny", "Soy", "Almond", "Oat"]
-SIZES = ["Small", "Regular", "Large"]
-QUANTITIES = [1, 1, 2, 2, 3, 4]  # Weighted towards 1-2
+COFFEE_TYPES = ("Flat White", "Americano", "Macchiato", "Cappuccino", "Latte", "Mocha", "Cold Brew")
+MILK_TYPES = ("Full Cream", "Skinny", "Soy", "Almond", "Oat")
+SIZES = ("Small", "Regular", "Large")
+_COFFEE_COUNT, _MILK_COUNT, _SIZE_COUNT = len(COFFEE_TYPES), len(MILK_TYPES), len(SIZES)
+# Order quantities and their cumulative weights (2:2:1:1), weighted towards 1-2
+QUANTITIES = (1, 2, 3, 4)
+QUANTITY_CUM_WEIGHTS = (2, 4, 5, 6)
 DEFAULT_ENDPOINT_URL = 'https://serverless.aws.yikyakyuk.com/cashier'
 DEFAULT_DELAY = 1.0  # seconds
 AUTO_REFRESH_RATE = 0.5  # seconds - faster refresh for better real-time feeling
 MAX_LOGS_DISPLAY = 1000  # Maximum number of logs to display
-
-# Thread-safe queues for communication between threads
-log_queue = queue.Queue()
-sample_data_queue = queue.Queue(maxsize=1)  # Hold the current sample data
+RENDER_TAIL = 100  # Most recent log entries shown in the log panel
+MAX_INFLIGHT_SENDS = 4  # Concurrent POSTs per worker, one sender thread each
+BATCH_SIZE = 10  # Records per POST when batching is enabled
+_HEADERS = {'Content-Type': 'application/json'}
+_REQUEST_TIMEOUT = (2, 5)  # seconds - (connect, read)
+# Wire format for a sale record. Every field except the customer name comes from
+# the constants above (or is hex/digits), so only the name needs JSON escaping.
+_JSON_TEMPLATE = ('{{"customer":{customer_json},"saleid":"{saleid}","timestamp":"{timestamp}",'
+                  '"coffee":"{coffee}","milk":"{milk}","size":"{size}","qty":{qty}}}')
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# (epoch second, formatted timestamp) of the last now_ts() call. Swapped as a
+# whole tuple so threads never see a second paired with another second's text.
+_TS_CACHE = [(0, "")]
 
 # ----------------------
 # Setup Functions
 # ----------------------
 
-def setup_logging() -> logging.Logger:
+@st.cache_resource(show_spinner=False)
+def get_first_names() -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
     """
-    Configure the logging system.
+    Get the en_US first names Faker draws from, with cumulative weights.
+    
+    Picking from these directly gives the same distribution as Faker's
+    first_name() without going through its provider proxy on every record.
+    Cached because the page script is re-executed on every rerun.
     
     Returns:
-        logging.Logger: Configured logger instance
+        Tuple[Tuple[str, ...], Tuple[float, ...]]: (Names, Cumulative weights)
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
-    return logging.getLogger('coffee_sales_generator')
+    names = PersonProvider.first_names
+    if isinstance(names, dict):  # Weighted {name: frequency} in current Faker releases
+        return tuple(names), tuple(accumulate(names.values()))
+    return tuple(names), tuple(range(1, len(names) + 1))
+
+def now_ts() -> str:
+    """
+    Get the current local time formatted for records and logs.
+    
+    The timestamp only has one-second resolution, so the formatted string is
+    reused until the second changes.
+    
+    Returns:
+        str: Current time as YYYY-MM-DD HH:MM:SS
+    """
+    t = int(time.time())
+    cached_t, cached_ts = _TS_CACHE[0]
+    if t != cached_t:
+        cached_ts = time.strftime(TIMESTAMP_FORMAT, time.localtime(t))
+        _TS_CACHE[0] = (t, cached_ts)
+    return cached_ts
 
 def initialize_session_state() -> None:
     """Initialize all required session state variables."""
     session_vars = {
         'running': False,
-        'logs': [],
+        'logs': deque(maxlen=MAX_LOGS_DISPLAY),
         'endpoint_url': DEFAULT_ENDPOINT_URL,
         'delay': DEFAULT_DELAY,
         'auto_refresh': True,
+        'batch_records': False,
         'stop_flag': False,
-        'last_sample_time': time.time()
+        'last_sample_time': time.time(),
+        # Single-slot cell the worker overwrites with its latest request body.
+        # Kept in session state so it survives reruns, which re-execute this module.
+        'latest_sample': [None],
+        # Buffer the worker threads append log lines to. deque append/popleft are
+        # atomic, so it needs no lock; maxlen drops the oldest entries if the main
+        # thread falls behind. Also kept in session state to survive reruns.
+        'log_queue': deque(maxlen=MAX_LOGS_DISPLAY),
+        'sample_body': None
     }
     
     # Initialize variables if they don't exist
@@ -75,106 +130,243 @@ def initialize_session_state() -> None:
         if var not in st.session_state:
             st.session_state[var] = default
     
-    # Initialize sample_data separately as it requires generation
-    if 'sample_data' not in st.session_state:
-        fake = Faker()
-        st.session_state['sample_data'] = generate_sale_record(fake)
+    # Initialize sample_json separately as it requires generation
+    if 'sample_json' not in st.session_state:
+        st.session_state['sample_json'] = format_sample_json(generate_sale_record(get_first_names())[0])
 
 # ----------------------
 # Data Generation Functions
 # ----------------------
 
-def generate_sale_record(faker: Faker) -> Dict[str, Any]:
+def generate_sale_record(
+    first_names: Tuple[Tuple[str, ...], Tuple[float, ...]]
+) -> Tuple[bytes, str]:
     """
     Generate a random coffee sale transaction record.
     
+    The record is rendered straight into its JSON request body; the UI decodes
+    it only when it needs to display a sample.
+    
     Args:
-        faker: Faker instance for generating customer names
+        first_names: (Names, Cumulative weights) to draw customer names from
     
     Returns:
-        Dict[str, Any]: A dictionary containing details of the coffee sale
-    """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    customer_name = faker.first_name()
-    sale_id = str(uuid.uuid4())[24:]  # Using last part of UUID
-    coffee = random.choice(COFFEE_TYPES)
-    milk = random.choice(MILK_TYPES)
-    size = random.choice(SIZES)
-    qty = random.choice(QUANTITIES)
-    
-    return {
-        "customer": customer_name,
-        "saleid": sale_id,
-        "timestamp": timestamp,
-        "coffee": coffee,
-        "milk": milk,
-        "size": size,
-        "qty": qty,
-        # Include metadata for easier log formatting
-        "_meta": {
-            "log_description": f"ID: {sale_id}, Time: {timestamp}, Customer: {customer_name}, "
-                              f"Order: {size} {coffee} with {milk} milk, Quantity: {qty}"
-        }
-    }
+        Tuple[bytes, str]: (UTF-8 JSON request body, Human-readable log line)
+    """
+    timestamp = now_ts()
+    rand = random.random
+    names, name_cum_weights = first_names
+    customer_name = names[bisect.bisect(name_cum_weights, rand() * name_cum_weights[-1], 0, len(names) - 1)]
+    sale_id = os.urandom(6).hex()  # 12 hex chars, same length as the old UUID tail
+    # Index the menus directly from one float each rather than via random.choice
+    coffee = COFFEE_TYPES[int(rand() * _COFFEE_COUNT)]
+    milk = MILK_TYPES[int(rand() * _MILK_COUNT)]
+    size = SIZES[int(rand() * _SIZE_COUNT)]
+    qty = QUANTITIES[bisect.bisect(QUANTITY_CUM_WEIGHTS, rand() * QUANTITY_CUM_WEIGHTS[-1])]
+    
+    body = _JSON_TEMPLATE.format(
+        customer_json=json.dumps(customer_name), saleid=sale_id, timestamp=timestamp,
+        coffee=coffee, milk=milk, size=size, qty=qty
+    ).encode('utf-8')
+    sale_log = (f"ID: {sale_id}, Time: {timestamp}, Customer: {customer_name}, "
+                f"Order: {size} {coffee} with {milk} milk, Quantity: {qty}")
+    return body, sale_log
+
+def join_batch(bodies: List[bytes], batched: bool) -> bytes:
+    """
+    Combine record bodies into a single request body.
+    
+    Args:
+        bodies: JSON request bodies of one or more coffee sale records
+        batched: Whether batching is enabled; batched bodies are always sent as a
+            JSON array, even when only one record is left to flush
+        
+    Returns:
+        bytes: A JSON array of records when batched, otherwise the single record body
+    """
+    if not batched:
+        return bodies[0]
+    return b'[' + b','.join(bodies) + b']'
+
+def format_sample_json(body: bytes) -> str:
+    """
+    Pretty-print a request body for the sample data preview.
+    
+    Args:
+        body: JSON request body of a coffee sale record
+        
+    Returns:
+        str: Indented JSON text
+    """
+    return json.dumps(json.loads(body), indent=2)
+
+def create_http_session() -> requests.Session:
+    """
+    Create a keep-alive HTTP session for a single sender thread.
     
-def send_message(record: Dict[str, Any], endpoint_url: str, logger: logging.Logger) -> Tuple[bool, Any]:
+    Returns:
+        requests.Session: Session with a small connection pool mounted for HTTP(S)
+    """
+    session = requests.Session()
+    # Retry only failures to open a connection, where the request was never sent.
+    # urllib3 never retries a POST on read or protocol errors, so a keep-alive
+    # socket the server has closed is handled by post_record instead.
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=1,
+        max_retries=Retry(total=1, connect=1, read=0, status=0, other=0)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def post_record(session: requests.Session, endpoint_url: str, body: bytes) -> requests.Response:
+    """
+    POST a request body, retrying once if the connection drops.
+    
+    A pooled keep-alive socket the server has already closed fails with a
+    ConnectionError that urllib3 will not retry for a POST. The broken connection
+    is discarded, so a second attempt goes out on a fresh one. At worst this
+    duplicates a record the server had already received, which is acceptable for
+    generated test data. Connect timeouts are not retried here because the
+    adapter's connect retry has already covered them.
+    
+    Args:
+        session: HTTP session to send with
+        endpoint_url: The URL to send data to
+        body: JSON request body
+        
+    Returns:
+        requests.Response: The endpoint's response
+    """
+    try:
+        return session.post(endpoint_url, data=body, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
+    except requests.exceptions.ConnectTimeout:
+        raise
+    except requests.exceptions.ConnectionError:
+        return session.post(endpoint_url, data=body, headers=_HEADERS, timeout=_REQUEST_TIMEOUT)
+
+def send_message(
+    body: bytes, 
+    endpoint_url: str, 
+    logger: logging.Logger, 
+    session: requests.Session
+) -> Tuple[bool, Any]:
     """
     Send a coffee sale record to the endpoint.
     
     Args:
-        record: The coffee sale record to send
+        body: JSON request body of the coffee sale record
         endpoint_url: The URL to send data to
         logger: Logger instance
+        session: HTTP session whose pooled connection is reused across sends
         
     Returns:
         Tuple[bool, Any]: (Success status, Response or error message)
     """
-    # Remove metadata before sending
-    data = {k: v for k, v in record.items() if k != '_meta'}
-    
     try:
-        headers = {'Content-Type': 'application/json'}
-        response = requests.post(
-            endpoint_url, 
-            data=json.dumps(data), 
-            headers=headers, 
-            timeout=5
-        )
+        response = post_record(session, endpoint_url, body)
         response.raise_for_status()
         return True, response.status_code
     except requests.exceptions.ConnectionError as e:
-        logger.error(f"Connection error: {str(e)}")
-        return False, f"Connection error: {str(e)}"
+        logger.error("Connection error: %s", e)
+        return False, f"Connection error: {e}"
     except requests.exceptions.Timeout as e:
-        logger.error(f"Request timed out: {str(e)}")
-        return False, f"Request timed out: {str(e)}"
+        logger.error("Request timed out: %s", e)
+        return False, f"Request timed out: {e}"
     except requests.exceptions.HTTPError as e:
-        logger.error(f"HTTP error: {str(e)}")
-        return False, f"HTTP error: {str(e)}"
+        logger.error("HTTP error: %s", e)
+        return False, f"HTTP error: {e}"
     except requests.exceptions.RequestException as e:
-        logger.error(f"Request error: {str(e)}")
-        return False, f"Request error: {str(e)}"
+        logger.error("Request error: %s", e)
+        return False, f"Request error: {e}"
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        return False, f"Unexpected error: {str(e)}"
+        logger.error("Unexpected error: %s", e)
+        return False, f"Unexpected error: {e}"
+
+def open_sender_session(thread_sessions: threading.local, sessions: List[requests.Session]) -> None:
+    """
+    Give the calling sender thread its own HTTP session.
+    
+    Used as the sender pool's thread initializer: requests does not promise that
+    a Session is thread-safe, so each sender thread keeps one in thread-local
+    storage. Sessions are also collected in a list so the worker can close them.
+    
+    Args:
+        thread_sessions: Thread-local holder for the sender's session
+        sessions: Every session opened for the pool
+    """
+    session = create_http_session()
+    thread_sessions.session = session
+    sessions.append(session)
+
+def send_and_log(
+    body: bytes, 
+    endpoint_url: str, 
+    logger: logging.Logger, 
+    thread_sessions: threading.local,
+    log_queue: deque
+) -> None:
+    """
+    Send a coffee sale record and log the outcome.
+    
+    Args:
+        body: JSON request body of the coffee sale record
+        endpoint_url: The URL to send data to
+        logger: Logger instance
+        thread_sessions: Thread-local holder of this sender thread's HTTP session
+        log_queue: Buffer to pass log lines to the main thread
+    """
+    success, result = send_message(body, endpoint_url, logger, thread_sessions.session)
+
+    if success:
+        send_log = f"Message sent successfully. Status code: {result}"
+        logger.info(send_log)
+        add_to_log_queue(log_queue, send_log)
+    else:
+        error_log = f"Failed to send message: {result}"
+        logger.error(error_log)
+        add_to_log_queue(log_queue, error_log, "ERROR")
 
 # ----------------------
 # Threading Functions
 # ----------------------
 
-def add_to_log_queue(message: str, level: str = "INFO") -> None:
+def add_to_log_queue(log_queue: deque, message: str, level: str = "INFO") -> None:
     """
     Add a log message to the log queue for processing in the main thread.
     
     Args:
+        log_queue: Buffer shared with the main thread
         message: The log message
         level: The log level (INFO, ERROR, etc.)
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    formatted_log = f"[{timestamp}] [{level}] {message}"
+    # Add to queue for the main thread to process; it formats each entry once
+    # when draining, off the worker threads
+    log_queue.append((time.time(), level, message))
+
+def format_log_entry(entry: Tuple[float, str, str]) -> str:
+    """
+    Format a log entry for display.
+    
+    Args:
+        entry: (Epoch timestamp, Log level, Message)
+        
+    Returns:
+        str: Log line as "[timestamp] [level] message"
+    """
+    logged_at, level, message = entry
+    return f"[{time.strftime(TIMESTAMP_FORMAT, time.localtime(logged_at))}] [{level}] {message}"
+
+def log_ui(message: str, level: str = "INFO") -> None:
+    """
+    Add a log message straight to the displayed logs from the main thread.
     
-    # Add to queue for the main thread to process
-    log_queue.put(formatted_log)
+    Args:
+        message: The log message
+        level: The log level (INFO, ERROR, etc.)
+    """
+    st.session_state['logs'].append(format_log_entry((time.time(), level, message)))
 
 def process_log_queue() -> bool:
     """
@@ -183,19 +375,22 @@ def process_log_queue() -> bool:
     Returns:
         bool: True if logs were updated, False otherwise
     """
-    updated = False
-    while not log_queue.empty():
+    # Move everything pending in one batch; popleft is atomic, so entries the
+    # worker appends meanwhile are simply picked up on the next drain. Each entry
+    # is formatted exactly once here and stored as its display line.
+    log_queue = st.session_state['log_queue']
+    pending = []
+    while True:
         try:
-            log_message = log_queue.get_nowait()
-            st.session_state['logs'].append(log_message)
-            updated = True
-            
-            # Keep logs within max length
-            if len(st.session_state['logs']) > MAX_LOGS_DISPLAY:
-                st.session_state['logs'] = st.session_state['logs'][-MAX_LOGS_DISPLAY:]
-        except queue.Empty:
+            pending.append(format_log_entry(log_queue.popleft()))
+        except IndexError:
             break
-    return updated
+    if not pending:
+        return False
+    
+    # The logs deque is bounded, so old entries drop off automatically
+    st.session_state['logs'].extend(pending)
+    return True
 
 def update_sample_data() -> bool:
     """
@@ -204,24 +399,19 @@ def update_sample_data() -> bool:
     Returns:
         bool: True if sample data was updated, False otherwise
     """
+    ss = st.session_state
     now = time.time()
-    elapsed = now - st.session_state['last_sample_time']
+    elapsed = now - ss['last_sample_time']
     
     # Check if it's time to update based on the delay setting
-    if elapsed >= st.session_state['delay']:
-        # Try to get new sample data if available
-        try:
-            if not sample_data_queue.empty():
-                st.session_state['sample_data'] = sample_data_queue.get_nowait()
-            # If queue is empty but enough time has passed, generate a new one
-            else:
-                fake = Faker()
-                st.session_state['sample_data'] = generate_sale_record(fake)
-            
-            st.session_state['last_sample_time'] = now
+    if elapsed >= ss['delay']:
+        # Only the worker thread generates records; keep the last sample when idle
+        sample = ss['latest_sample'][0]
+        if sample is not None and sample is not ss['sample_body']:
+            ss['sample_body'] = sample
+            ss['sample_json'] = format_sample_json(sample)
+            ss['last_sample_time'] = now
             return True
-        except queue.Empty:
-            pass
     
     return False
 
@@ -229,7 +419,11 @@ def data_generation_worker(
     delay: float, 
     endpoint_url: str, 
     logger: logging.Logger, 
-    stop_flag_event: threading.Event
+    stop_flag_event: threading.Event,
+    first_names: Tuple[Tuple[str, ...], Tuple[float, ...]],
+    latest_sample: List[Optional[bytes]],
+    log_queue: deque,
+    batch_size: int = 1
 ) -> None:
     """
     Worker function to generate and send data at regular intervals.
@@ -239,55 +433,73 @@ def data_generation_worker(
         endpoint_url: The URL to send data to
         logger: Logger instance
         stop_flag_event: Event to signal when to stop
+        first_names: (Names, Cumulative weights) to draw customer names from
+        latest_sample: Single-element list holding the most recent request body for the UI
+        log_queue: Buffer to pass log lines to the main thread
+        batch_size: Records to combine into one POST (1 sends each record on its own)
     """
-    fake = Faker()
-    add_to_log_queue(f"Data generation thread started with {delay}s delay to {endpoint_url}")
-    logger.info(f"Data generation thread started with {delay}s delay to {endpoint_url}")
+    add_to_log_queue(log_queue, f"Data generation thread started with {delay}s delay to {endpoint_url}")
+    logger.info("Data generation thread started with %ss delay to %s", delay, endpoint_url)
+    
+    # Sends run on a small pool, so a slow response overlaps with generating and
+    # sending the next records instead of stalling the loop. Each sender thread
+    # opens its own keep-alive session when it starts.
+    thread_sessions = threading.local()
+    sessions: List[requests.Session] = []
+    executor = ThreadPoolExecutor(
+        max_workers=MAX_INFLIGHT_SENDS,
+        thread_name_prefix='coffee-send',
+        initializer=open_sender_session,
+        initargs=(thread_sessions, sessions)
+    )
+    inflight = threading.BoundedSemaphore(MAX_INFLIGHT_SENDS)
+    pending: List[bytes] = []
+    batched = batch_size > 1
     
     try:
         while not stop_flag_event.is_set():
-            # Generate a record
-            record = generate_sale_record(fake)
+            # Reserve a send slot, re-checking the stop flag while the endpoint is slow
+            if not inflight.acquire(timeout=delay):
+                continue
             
-            # Update the sample data queue (non-blocking)
-            try:
-                # Clear the queue if it has old data
-                while not sample_data_queue.empty():
-                    sample_data_queue.get_nowait()
-                
-                # Add the new data
-                sample_data_queue.put_nowait(record)
-            except queue.Full:
-                pass  # If queue is full, just skip updating sample data
+            # Generate a record body and its log line
+            body, sale_log = generate_sale_record(first_names)
+            
+            # Publish the latest sample (a single store is atomic under the GIL)
+            latest_sample[0] = body
             
-            # Log the generated sale with _meta information
-            sale_log = record['_meta']['log_description']
+            # Log the generated sale
             logger.info(sale_log)
-            add_to_log_queue(sale_log)
+            add_to_log_queue(log_queue, sale_log)
                 
-            # Send the record
-            success, result = send_message(record, endpoint_url, logger)
-
-            if success:
-                send_log = f"Message sent successfully. Status code: {result}"
-                logger.info(send_log)
-                add_to_log_queue(send_log)
+            # Send the batch in the background once it is full; the slot is freed
+            # when the send completes. A partial batch is only flushed on stop.
+            pending.append(body)
+            if len(pending) >= batch_size:
+                future = executor.submit(send_and_log, join_batch(pending, batched), endpoint_url,
+                                         logger, thread_sessions, log_queue)
+                future.add_done_callback(lambda _: inflight.release())
+                pending = []
             else:
-                error_log = f"Failed to send message: {result}"
-                logger.error(error_log)
-                add_to_log_queue(error_log, "ERROR")
+                inflight.release()
             
-            # Wait before next iteration with periodic checks for stop signal
-            for _ in range(int(delay * 10)):  # Check stop flag more frequently
-                if stop_flag_event.is_set():
-                    break
-                time.sleep(0.1)
+            # Wait before next iteration; returns early as soon as stop is signalled
+            if stop_flag_event.wait(timeout=delay):
+                break
     except Exception as e:
         error_msg = f"Unexpected error in data generation thread: {str(e)}"
         logger.exception(error_msg)
-        add_to_log_queue(error_msg, "ERROR")
+        add_to_log_queue(log_queue, error_msg, "ERROR")
     finally:
-        add_to_log_queue("Data generation thread stopped")
+        # Flush any partial batch, then let in-flight sends finish (each is
+        # bounded by the request timeout)
+        if pending:
+            executor.submit(send_and_log, join_batch(pending, batched), endpoint_url,
+                            logger, thread_sessions, log_queue)
+        executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
+        add_to_log_queue(log_queue, "Data generation thread stopped")
         logger.info("Data generation thread stopped")
 
 # ----------------------
@@ -304,8 +516,7 @@ def handle_start_button() -> None:
     
     delay = st.session_state['delay']
     endpoint_url = st.session_state['endpoint_url']
-    
-    logger = logging.getLogger('coffee_sales_generator')
+    batch_size = BATCH_SIZE if st.session_state['batch_records'] else 1
     
     # Create an event for thread communication
     stop_flag_event = threading.Event()
@@ -316,7 +527,8 @@ def handle_start_button() -> None:
     # Create and start thread
     thread = threading.Thread(
         target=data_generation_worker,
-        args=(delay, endpoint_url, logger, stop_flag_event),
+        args=(delay, endpoint_url, _LOGGER, stop_flag_event, get_first_names(),
+              st.session_state['latest_sample'], st.session_state['log_queue'], batch_size),
         daemon=True
     )
     thread.start()
@@ -325,8 +537,8 @@ def handle_start_button() -> None:
     st.session_state['generator_thread'] = thread
     
     log_message = f"Started data generation with {delay}s delay to {endpoint_url}"
-    logger.info(log_message)
-    st.session_state['logs'].append(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] {log_message}")
+    _LOGGER.info(log_message)
+    log_ui(log_message)
 
 def handle_stop_button() -> None:
     """Handle the Stop button click."""
@@ -341,15 +553,13 @@ def handle_stop_button() -> None:
     st.session_state['stop_flag'] = True
     
     log_message = "Stopping data generation..."
-    logger = logging.getLogger('coffee_sales_generator')
-    logger.info(log_message)
-    st.session_state['logs'].append(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] {log_message}")
+    _LOGGER.info(log_message)
+    log_ui(log_message)
 
 def handle_clear_logs() -> None:
     """Handle the Clear Logs button click."""
-    st.session_state['logs'] = []
-    log_message = "Logs cleared"
-    st.session_state['logs'].append(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [INFO] {log_message}")
+    st.session_state['logs'].clear()
+    log_ui("Logs cleared")
 
 # ----------------------
 # UI Rendering Functions
@@ -384,6 +594,16 @@ def render_config_section() -> None:
         on_change=lambda: setattr(st.session_state, 'delay', st.session_state.config_delay)
     )
     
+    st.checkbox(
+        f"Batch {BATCH_SIZE} records per request",
+        value=st.session_state['batch_records'],
+        key="config_batch_records",
+        help=(f"Sends every {BATCH_SIZE} records as one JSON array, so each POST goes out "
+              f"{BATCH_SIZE} x the delay apart; any partial batch is sent on stop. "
+              "Only enable if the endpoint accepts arrays."),
+        on_change=lambda: setattr(st.session_state, 'batch_records', st.session_state.config_batch_records)
+    )
+    
     col1, col2 = st.columns(2)
     with col1:
         if not st.session_state['running']:
@@ -413,6 +633,7 @@ def render_about_section() -> None:
         
         ### Features:
         - Customizable sending rate (delay between records)
+        - Optional batching of records into a single request
         - Real-time log display
         - Sample data preview
         - Configurable API endpoint
@@ -421,24 +642,56 @@ def render_about_section() -> None:
         and demonstrating real-time data processing capabilities.
         """)
 
+def is_worker_active() -> bool:
+    """
+    Check whether the generator is running or still finishing its last sends.
+    
+    Returns:
+        bool: True while the worker thread may still produce logs or samples
+    """
+    thread = st.session_state.get('generator_thread')
+    return st.session_state['running'] or (thread is not None and thread.is_alive())
+
 def render_sample_data() -> None:
     """Render the sample data preview."""
+    # Update sample data at the same rate as the delay timer
+    update_sample_data()
+    
     with st.expander("Sample Data Preview", expanded=True):
-        # This will show the current sample data that updates at the same rate as the delay
-        st.json(st.session_state['sample_data'])
+        # This will show the current sample data that updates at the same rate as the delay.
+        # The text is formatted once per new sample, so idle reruns just resend the string.
+        st.code(st.session_state['sample_json'], language='json')
 
 def render_log_display() -> None:
     """Render the log display section."""
     st.header("Activity Logs")
     
-    if st.session_state['logs']:
-        for log in reversed(st.session_state['logs'][-MAX_LOGS_DISPLAY:]):
-            st.text(log)
+    logs = st.session_state['logs']
+    if logs:
+        # Newest first, sent to the browser as a single element
+        st.text("\n".join(islice(reversed(logs), RENDER_TAIL)))
         
-        st.text(f"Total log entries: {len(st.session_state['logs'])}")
+        st.text(f"Total log entries: {len(logs)} (showing latest {min(len(logs), RENDER_TAIL)})")
     else:
         st.info("No logs yet. Start the generator to see activity.")
 
+def render_activity_panel() -> None:
+    """Render the generator status and activity logs."""
+    # Process any queued logs from the worker thread
+    process_log_queue()
+    
+    if st.session_state['running']:
+        st.success("✅ Generator is running")
+    else:
+        st.warning("⏸️ Generator is stopped")
+    
+    render_log_display()
+    
+    # Once the worker has fully stopped, rerun the whole page so the live
+    # panels are rebuilt without run_every and stop ticking
+    if st.session_state['live_refresh'] and not is_worker_active():
+        st.rerun()
+
 def render_footer() -> None:
     """Render the application footer."""
     st.markdown("---")
@@ -448,6 +701,12 @@ def render_main_content() -> None:
     """Render the main content area with a 50/50 layout."""
     st.title("☕ Coffee Shop Sales Generator")
     
+    # The sample preview and activity panel refresh themselves as fragments while
+    # the worker is active, so the rest of the page is not re-executed per tick
+    ss = st.session_state
+    refresh = AUTO_REFRESH_RATE if ss['auto_refresh'] and is_worker_active() else None
+    ss['live_refresh'] = refresh is not None
+    
     # Split the screen into two columns for 50/50 layout
     col1, col2 = st.columns(2)
     
@@ -455,17 +714,11 @@ def render_main_content() -> None:
         # Left side - Configuration and about sections
         render_config_section()
         st.markdown("---")
-        render_sample_data()
+        st.fragment(run_every=refresh)(render_sample_data)()
     
     with col2:
         # Right side - Status indicator and log display
-        if st.session_state['running']:
-            st.success("✅ Generator is running")
-        else:
-            st.warning("⏸️ Generator is stopped")
-        
-        # Log display
-        render_log_display()
+        st.fragment(run_every=refresh)(render_activity_panel)()
     
     # Footer spans the full width
     render_footer()
@@ -477,28 +730,15 @@ def render_main_content() -> None:
 def main() -> None:
     """Main application entry point."""
     # Setup
-
-    logger = setup_logging()
     initialize_session_state()
     
     with st.sidebar:
     # Render the sidebar
         common.render_sidebar()
         render_about_section()
-        
-    # Process any queued logs from the worker thread
-    logs_updated = process_log_queue()
-    
-    # Update sample data at the same rate as the delay timer
-    sample_updated = update_sample_data()
     
     # Render UI components
     render_main_content()
-    
-    # Handle auto-refresh if needed
-    if st.session_state['auto_refresh'] and (st.session_state['running'] or logs_updated or sample_updated):
-        time.sleep(AUTO_REFRESH_RATE)  # Slightly faster refresh for better real-time feeling
-        st.rerun()
 
 if __name__ == "__main__":
     render_page_config()
@@ -511,7 +751,6 @@ if __name__ == "__main__":
             main()
     except Exception as e:
         # Log and display any uncaught exceptions
-        logger = logging.getLogger('coffee_sales_generator')
-        logger.exception(f"Uncaught application error: {str(e)}")
+        _LOGGER.exception("Uncaught application error: %s", e)
         st.error(f"An unexpected error occurred: {str(e)}")
         st.exception(e)
@@ -8,7 +8,6 @@ and monitor the results in real-time. It supports IPv4, IPv6, and domain names.
 
 import streamlit as st
 import subprocess
-import time
 import re
 import threading
 import platform
@@ -26,6 +25,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger("network_ping_monitor")
 
+# Dot-separated labels of up to 63 characters ending in an alphabetic TLD
+_DOMAIN_RE = re.compile(
+    r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$"
+)
+
+# How often the results panel refreshes while pinging, in seconds
+_RESULTS_REFRESH_SECONDS = 0.2
+
 
 def initialize_session_state() -> None:
     """
@@ -39,6 +46,8 @@ def initialize_session_state() -> None:
         st.session_state.ping_queue = queue.Queue()
     if 'ping_results' not in st.session_state:
         st.session_state.ping_results = []
+    if 'validated_target' not in st.session_state:
+        st.session_state.validated_target = (None, False)
 
 
 def is_valid_ipv4(ip: str) -> bool:
@@ -85,32 +94,38 @@ def is_valid_domain(domain: str) -> bool:
     Returns:
         bool: True if valid domain name, False otherwise
     """
-    if len(domain) > 255:
-        return False
-    domain_pattern = re.compile(
-        r"^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}$"
-    )
-    return bool(domain_pattern.match(domain))
+    return len(domain) <= 255 and bool(_DOMAIN_RE.match(domain))
 
 
 def validate_target(target: str) -> Union[str, bool]:
     """
     Validate if the input string is a valid IP address or domain name.
     
+    The result for the last target is kept in session state, so reruns with an
+    unchanged input skip re-validation. A functools.lru_cache would not help
+    here because the page script is re-executed on every rerun.
+    
     Args:
         target: String to validate
         
     Returns:
         str or bool: "IPv4", "IPv6", "Domain" if valid, False otherwise
     """
+    cached_target, cached_type = st.session_state.validated_target
+    if target == cached_target:
+        return cached_type
+    
     if is_valid_ipv4(target):
-        return "IPv4"
+        target_type = "IPv4"
     elif is_valid_ipv6(target):
-        return "IPv6"
+        target_type = "IPv6"
     elif is_valid_domain(target):
-        return "Domain"
+        target_type = "Domain"
     else:
-        return False
+        target_type = False
+    
+    st.session_state.validated_target = (target, target_type)
+    return target_type
 
 
 def read_ping_output(process: subprocess.Popen, queue_obj: queue.Queue) -> None:
@@ -280,17 +295,17 @@ def render_ui() -> None:
     st.title("Network Ping Monitor")
     
     with st.container(border=True):
-        st.session_state.target = st.text_input(
+        st.text_input(
             "Enter IP Address or Domain Name", 
+            key="target",
             help="Enter a valid IPv4/IPv6 address (e.g., 192.168.1.1, 2001:db8::1) or domain name (e.g., example.com)"
         )
 
+        # Callbacks run before the rerun, so the button matches the new state
         if st.session_state.is_pinging:
-            if st.button("Stop Ping", key="stop", type="primary"):
-                stop_ping()
+            st.button("Stop Ping", key="stop", type="primary", on_click=stop_ping)
         else:
-            if st.button("Start Ping", key="start", type="primary"):
-                start_ping()
+            st.button("Start Ping", key="start", type="primary", on_click=start_ping)
 
         # Show info about the target type if entered
         if st.session_state.target:
@@ -298,36 +313,38 @@ def render_ui() -> None:
             if target_type:
                 st.info(f"Target type detected: {target_type}")
 
-    # Create a container for ping results
-    results_container = st.container()
+    # While pinging, only the results panel reruns on a timer rather than the whole page
+    run_every = _RESULTS_REFRESH_SECONDS if st.session_state.is_pinging else None
+    st.fragment(run_every=run_every)(render_ping_results)()
+
 
-    # Show results placeholder
-    with results_container:
-        st.subheader("Ping Results")
-        ping_text = st.empty()
+def render_ping_results() -> None:
+    """
+    Render the ping results, moving any new output from the queue first.
+    """
+    st.subheader("Ping Results")
 
     # Update ping results in real-time
     if st.session_state.is_pinging:
         # Process any new ping results in the queue
         max_displayed_lines = 20
         
-        while not st.session_state.ping_queue.empty():
-            try:
-                line = st.session_state.ping_queue.get()
-                st.session_state.ping_results.append(line)
-                # Keep only the most recent results
-                if len(st.session_state.ping_results) > max_displayed_lines:
-                    st.session_state.ping_results.pop(0)
-            except Exception as e:
-                logger.error(f"Error processing ping results: {str(e)}")
+        new_lines = []
+        ping_queue = st.session_state.ping_queue
+        try:
+            while True:
+                new_lines.append(ping_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if new_lines:
+            results = st.session_state.ping_results
+            results.extend(new_lines)
+            # Keep only the most recent results
+            del results[:-max_displayed_lines]
         
         # Display ping results
-        ping_text.code('\n'.join(st.session_state.ping_results))
-
-    # Run this in an infinite loop to update the UI
-    if st.session_state.is_pinging:
-        time.sleep(0.1)
-        st.rerun()
+        st.code('\n'.join(st.session_state.ping_results))
 
 
 def main() -> None: